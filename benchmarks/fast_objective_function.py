@@ -0,0 +1,55 @@
+# Compares the per-call overhead of `objective_function` and
+# `objective_function_fast` against the bare kernel of each mathematical
+# test function. Run with: python benchmarks/fast_objective_function.py
+
+import timeit
+import numpy as np
+
+from surfaces.test_functions.mathematical import mathematical_functions
+
+
+n_calls = 10000
+n_repeats = 5
+
+
+def time_per_call(function, *args):
+    times = timeit.repeat(lambda: function(*args), number=n_calls, repeat=n_repeats)
+    return min(times) / n_calls
+
+
+print(
+    "{:<28}{:>12}{:>14}{:>14}{:>12}{:>12}".format(
+        "function", "kernel [us]", "objf [us]", "fast [us]", "objf/kern", "fast/kern"
+    )
+)
+
+for test_function in mathematical_functions:
+    try:
+        test_function_ = test_function()
+    except TypeError:
+        test_function_ = test_function(n_dim=2)
+
+    search_space = test_function_.search_space(value_types="array")
+    args = [
+        np.float64(dim_values[len(dim_values) // 3])
+        for dim_values in search_space.values()
+    ]
+    para = dict(zip(search_space.keys(), args))
+
+    t_kernel = time_per_call(test_function_.pure_objective_function, para)
+    # a caller holding positional coordinates has to build the dict first
+    t_objective = time_per_call(
+        lambda *args: test_function_.objective_function(dict(zip(para, args))), *args
+    )
+    t_fast = time_per_call(test_function_.objective_function_fast, *args)
+
+    print(
+        "{:<28}{:>12.2f}{:>14.2f}{:>14.2f}{:>12.2f}{:>12.2f}".format(
+            test_function.__name__,
+            t_kernel * 1e6,
+            t_objective * 1e6,
+            t_fast * 1e6,
+            t_objective / t_kernel,
+            t_fast / t_kernel,
+        )
+    )
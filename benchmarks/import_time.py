@@ -0,0 +1,60 @@
+# Measures the time of importing parts of the package in a fresh interpreter
+# and lists the heavy dependencies each import pulls in.
+# Run with: python benchmarks/import_time.py
+
+import sys
+import subprocess
+
+
+n_repeats = 5
+
+modules = [
+    "surfaces",
+    "surfaces.test_functions.mathematical",
+    "surfaces.test_functions",
+    "surfaces.visualize",
+    "surfaces.data_collector",
+    "surfaces.test_functions.machine_learning",
+]
+
+heavy_dependencies = [
+    "sklearn",
+    "pandas",
+    "hyperactive",
+    "gradient_free_optimizers",
+    "search_data_collector",
+    "plotly",
+    "matplotlib",
+]
+
+script = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(",".join(m for m in {heavy_dependencies!r} if m in sys.modules))
+"""
+
+
+def import_time(module):
+    times = []
+    for _ in range(n_repeats):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                script.format(module=module, heavy_dependencies=heavy_dependencies),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()
+        times.append(float(output[0]))
+    return min(times), output[1] if len(output) > 1 else ""
+
+
+print("{:<44}{:>12}  {}".format("module", "import [ms]", "heavy dependencies"))
+
+for module in modules:
+    t_import, imported = import_time(module)
+    print("{:<44}{:>12.1f}  {}".format(module, t_import * 1e3, imported))
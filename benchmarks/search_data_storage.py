@@ -0,0 +1,93 @@
+# Compares the load time and the peak memory of reading a search data table
+# from the SQLite and the Parquet storage. Every load runs in a fresh
+# interpreter. Run with: python benchmarks/search_data_storage.py
+
+import os
+import sys
+import tempfile
+import subprocess
+import numpy as np
+import pandas as pd
+
+from surfaces.data_collector import SurfacesDataCollector
+
+
+n_rows = 1_000_000
+n_repeats = 3
+table = "benchmark"
+
+script = """
+import time, resource
+from surfaces.data_collector import SurfacesDataCollector
+
+sdc = SurfacesDataCollector(path={path!r}, storage={storage!r})
+start = time.perf_counter()
+search_data = sdc.load({table!r}, columns={columns!r}, filters={filters!r})
+print(time.perf_counter() - start)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+loads = {
+    "full table": dict(columns=None, filters=None),
+    "score column": dict(columns=["score"], filters=None),
+    "x0 == 0": dict(columns=None, filters={"x0": 0}),
+}
+
+
+def create_search_data():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "x0": rng.integers(0, 100, n_rows),
+            "x1": rng.integers(0, 100, n_rows),
+            "x2": rng.random(n_rows),
+            "dataset": rng.choice(["digits_data", "wine_data", "iris_data"], n_rows),
+            "score": rng.random(n_rows),
+        }
+    )
+
+
+def load_in_subprocess(path, storage, columns, filters):
+    results = []
+    for _ in range(n_repeats):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                script.format(
+                    path=path,
+                    storage=storage,
+                    table=table,
+                    columns=columns,
+                    filters=filters,
+                ),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()
+        results.append((float(output[0]), int(output[1])))
+    # ru_maxrss is in kilobytes on linux
+    t_load, max_rss = min(results)
+    return t_load, max_rss / 1024
+
+
+search_data = create_search_data()
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    paths = {
+        "sql": os.path.join(tmp_dir, "search_data.db"),
+        "parquet": os.path.join(tmp_dir, "search_data"),
+    }
+    for storage, path in paths.items():
+        SurfacesDataCollector(path=path, storage=storage).save(table, search_data)
+
+    print("{:<10}{:<16}{:>12}{:>14}".format("storage", "load", "time [s]", "RSS [MiB]"))
+    for storage, path in paths.items():
+        for load_name, load_kwargs in loads.items():
+            t_load, max_rss = load_in_subprocess(path, storage, **load_kwargs)
+            print(
+                "{:<10}{:<16}{:>12.3f}{:>14.1f}".format(
+                    storage, load_name, t_load, max_rss
+                )
+            )
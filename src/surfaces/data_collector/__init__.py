@@ -2,4 +2,28 @@
 # Email: simon.blanke@yahoo.com
 # License: MIT License
 
-from .surfaces_data_collector import SurfacesDataCollector
+
+__all__ = [
+    "SurfacesDataCollector",
+    "ScoreTensor",
+    "SqlStorage",
+    "ParquetStorage",
+]
+
+
+def __getattr__(name):
+    # the collector imports pandas, sqlalchemy and gradient-free-optimizers.
+    # It is imported on first access.
+    if name == "SurfacesDataCollector":
+        from .surfaces_data_collector import SurfacesDataCollector
+
+        return SurfacesDataCollector
+    if name == "ScoreTensor":
+        from .score_tensor import ScoreTensor
+
+        return ScoreTensor
+    if name in ("SqlStorage", "ParquetStorage"):
+        from . import storage
+
+        return getattr(storage, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
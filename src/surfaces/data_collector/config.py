@@ -9,3 +9,8 @@ here_path = os.path.dirname(os.path.realpath(__file__))
 default_search_data_path = os.path.abspath(
     os.path.join(here_path, "..", "search_data.db")
 )
+
+default_search_data_paths = {
+    "sql": default_search_data_path,
+    "parquet": os.path.abspath(os.path.join(here_path, "..", "search_data")),
+}
@@ -0,0 +1,8 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+
+def encode_value(value):
+    # functions, like the datasets, are stored by their name
+    return getattr(value, "__name__", value)
@@ -0,0 +1,101 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+
+import numpy as np
+
+from .encoding import encode_value
+
+
+class ScoreTensor:
+    # dense array of scores with one axis per parameter. The scores are indexed
+    # by the position of the parameter values in the search space.
+
+    def __init__(self, scores, search_space):
+        self.para_names = list(search_space.keys())
+        self.dim_positions = [
+            {encode_value(value): pos for pos, value in enumerate(dim_values)}
+            for dim_values in search_space.values()
+        ]
+
+        shape = tuple(len(dim_positions) for dim_positions in self.dim_positions)
+        if scores.shape != shape:
+            msg = (
+                f"Scores of shape {scores.shape} do not match the search space {shape}"
+            )
+            raise ValueError(msg)
+        self.scores = scores
+
+    @classmethod
+    def from_search_data(cls, search_data, search_space):
+        scores = np.full(
+            tuple(len(dim_values) for dim_values in search_space.values()), np.nan
+        )
+        score_tensor = cls(scores, search_space)
+
+        # rows with values outside of the search space are skipped
+        positions = np.array(
+            [
+                [dim_positions.get(value, -1) for value in search_data[para_name]]
+                for para_name, dim_positions in zip(
+                    score_tensor.para_names, score_tensor.dim_positions
+                )
+            ],
+            dtype=np.intp,
+        ).reshape(len(score_tensor.para_names), -1)
+        in_search_space = np.all(positions >= 0, axis=0)
+
+        scores_ = np.asarray(search_data["score"], dtype=float)
+        scores[tuple(positions[:, in_search_space])] = scores_[in_search_space]
+        return score_tensor
+
+    @classmethod
+    def load(cls, path, search_space, mmap_mode="r"):
+        # the memory map is shared through the page cache of the system
+        return cls(np.load(path, mmap_mode=mmap_mode), search_space)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # memory maps are reopened instead of copied into other processes
+        if isinstance(self.scores, np.memmap):
+            state["scores"] = (self.scores.filename, self.scores.mode)
+        return state
+
+    def __setstate__(self, state):
+        if isinstance(state["scores"], tuple):
+            path, mmap_mode = state["scores"]
+            state["scores"] = np.load(path, mmap_mode=mmap_mode)
+        self.__dict__.update(state)
+
+    def save(self, path):
+        np.save(path, np.asarray(self.scores))
+
+    def params2positions(self, list_of_params):
+        positions = np.empty((len(list_of_params), len(self.para_names)), np.intp)
+        for dim, (para_name, dim_positions) in enumerate(
+            zip(self.para_names, self.dim_positions)
+        ):
+            try:
+                positions[:, dim] = [
+                    dim_positions[encode_value(params[para_name])]
+                    for params in list_of_params
+                ]
+            except KeyError as e:
+                msg = f"Value {e.args[0]!r} of '{para_name}' is not in the search space"
+                raise KeyError(msg) from None
+        return positions
+
+    def lookup_positions(self, positions):
+        # positions has the shape (n_samples, n_dim)
+        scores = np.asarray(self.scores[tuple(np.asarray(positions).T)])
+
+        missing = np.isnan(scores)
+        if missing.any():
+            position = np.asarray(positions)[missing.argmax()]
+            msg = f"No score for the positions {position.tolist()} in the search data"
+            raise KeyError(msg)
+        return scores
+
+    def lookup(self, list_of_params):
+        return self.lookup_positions(self.params2positions(list_of_params))
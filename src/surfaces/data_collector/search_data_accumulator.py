@@ -0,0 +1,41 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+
+import pandas as pd
+
+
+class SearchDataAccumulator:
+    # append-only store of search data rows, that keeps the first row of every
+    # parameter combination. The rows are concatenated once, in to_frame.
+
+    def __init__(self, para_names, columns=None):
+        self.para_names = list(para_names)
+        self.columns = self.para_names + ["score"] if columns is None else columns
+
+        self.seen = set()
+        self.chunks = []
+        self.n_rows = 0
+
+    def __len__(self):
+        return self.n_rows
+
+    def add(self, search_data):
+        para_values = search_data[self.para_names].itertuples(index=False, name=None)
+
+        new_rows = []
+        for row, key in enumerate(para_values):
+            if key not in self.seen:
+                self.seen.add(key)
+                new_rows.append(row)
+
+        if new_rows:
+            self.chunks.append(search_data.iloc[new_rows][self.columns])
+            self.n_rows += len(new_rows)
+        return len(new_rows)
+
+    def to_frame(self):
+        if not self.chunks:
+            return pd.DataFrame([], columns=self.columns)
+        return pd.concat(self.chunks, ignore_index=True)
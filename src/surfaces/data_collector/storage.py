@@ -0,0 +1,394 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+
+import os
+import time
+import uuid
+import queue
+import shutil
+import threading
+import numpy as np
+import pandas as pd
+import sqlalchemy as sql
+
+from search_data_collector import SqlSearchData
+from search_data_collector.search_data_converter import SearchDataConverter
+
+from .encoding import encode_value
+
+
+# storages hold tables of search data. They implement has_table, load, save,
+# remove and tables. load accepts a projection on columns and filters, a dict
+# of {column: value or list of values}, that selects the rows.
+
+
+# columns of a search data table, that are not parameters. The scores of a
+# list of metrics are stored in the columns metric_prefix + metric.
+non_parameter_columns = ("score", "eval_time", "fit_time", "score_time")
+metric_prefix = "metric_"
+# suffix of the tables, that hold the values of encoded categorical columns
+dictionary_suffix = "__dictionary"
+
+
+def _filter_value(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return encode_value(value)
+
+
+def _filter_values(values):
+    if isinstance(values, (list, tuple, set, np.ndarray)):
+        return [_filter_value(value) for value in values]
+    return [_filter_value(values)]
+
+
+def _sql_type(series):
+    if pd.api.types.is_integer_dtype(series):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(series):
+        return "FLOAT"
+    return "TEXT"
+
+
+def is_parameter_column(column):
+    return column not in non_parameter_columns and not column.startswith(metric_prefix)
+
+
+def categorical_columns(search_data):
+    return [
+        column
+        for column in search_data.columns
+        if is_parameter_column(column) and search_data[column].dtype == object
+    ]
+
+
+def encode_categories(search_data, dictionary):
+    # replaces the values of categorical columns by their position in the
+    # dictionary {column: [values]}. New values are appended to it.
+    search_data = search_data.copy()
+    new_entries = []
+    for column in categorical_columns(search_data):
+        values = dictionary.setdefault(column, [])
+        codes = {value: code for code, value in enumerate(values)}
+        for value in pd.unique(search_data[column]):
+            if value not in codes:
+                codes[value] = len(values)
+                values.append(value)
+                new_entries.append((column, codes[value], value))
+
+        search_data[column] = pd.to_numeric(
+            search_data[column].map(codes), downcast="integer"
+        )
+    return search_data, new_entries
+
+
+def decode_categories(search_data, dictionary):
+    for column, values in dictionary.items():
+        if column in search_data.columns:
+            codes = search_data[column].to_numpy()
+            search_data[column] = np.asarray(values, dtype=object)[codes]
+    return search_data
+
+
+class SqlStorage(SqlSearchData):
+    # tables of a SQLite database, that the first save switches to WAL mode,
+    # so reads do not block the writer. Loading never modifies the database.
+    # The parameter columns of every table have a composite index.
+
+    # rows per executemany of a save
+    chunksize = 10_000
+    # seconds a connection waits for the lock of another writer
+    timeout = 60
+
+    def __init__(self, path, compact=False):
+        super().__init__(path, func2str=True)
+        # compact tables store categorical parameters as integer codes. The
+        # values of the codes are in the dictionary table of the table.
+        self.compact = compact
+
+        self.dbEngine = sql.create_engine(
+            self.ml_data_path, connect_args={"timeout": self.timeout}
+        )
+
+    def _set_wal_mode(self):
+        # the journal mode is stored in the database file
+        with self.dbEngine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+
+    def has_table(self, table):
+        return os.path.isfile(self.path) and sql.inspect(self.dbEngine).has_table(table)
+
+    @property
+    def tables(self):
+        if not os.path.isfile(self.path):
+            return []
+        return [
+            table
+            for table in sql.inspect(self.dbEngine).get_table_names()
+            if not table.endswith(dictionary_suffix)
+        ]
+
+    def load_dictionary(self, table):
+        dictionary_table = table + dictionary_suffix
+        if not self.has_table(dictionary_table):
+            return None
+
+        entries = pd.read_sql_table(dictionary_table, self.dbEngine)
+        entries = entries.sort_values("code")
+        return {
+            column: list(column_entries["value"])
+            for column, column_entries in entries.groupby("column")
+        }
+
+    def load(self, table, search_space=None, columns=None, filters=None):
+        if not os.path.isfile(self.path):
+            msg = "SQL Database does not exist in path: " + self.path
+            raise FileNotFoundError(msg)
+        dictionary = self.load_dictionary(table)
+
+        # the projection and the filters are part of the query
+        sql_table = sql.Table(table, sql.MetaData(), autoload_with=self.dbEngine)
+        if columns is None:
+            query = sql.select(sql_table)
+        else:
+            query = sql.select(*(sql_table.c[column] for column in columns))
+        if filters:
+            for column, values in filters.items():
+                values = _filter_values(values)
+                if dictionary and column in dictionary:
+                    # the filters of encoded columns compare the codes
+                    values = [
+                        code
+                        for code, value in enumerate(dictionary[column])
+                        if value in values
+                    ]
+                query = query.where(sql_table.c[column].in_(values))
+
+        with self.dbEngine.connect() as connection:
+            search_data = pd.read_sql(query, connection)
+        if dictionary:
+            search_data = decode_categories(search_data, dictionary)
+
+        if search_space is not None:
+            search_data = self.conv.str2func(search_data, search_space)
+        return search_data
+
+    def save(self, table, dataframe, if_exists="replace"):
+        if self.func2str:
+            dataframe = self.conv.func2str(dataframe.copy())
+
+        dictionary_table = table + dictionary_suffix
+        new_columns = []
+        if if_exists == "append" and self.has_table(table):
+            # appended rows use the encoding of the existing table
+            dictionary = self.load_dictionary(table)
+            # e.g. the eval_time column is missing from older tables
+            columns = [
+                column["name"]
+                for column in sql.inspect(self.dbEngine).get_columns(table)
+            ]
+            new_columns = [
+                column for column in dataframe.columns if column not in columns
+            ]
+        else:
+            dictionary = {} if self.compact else None
+
+        new_entries = []
+        if dictionary is not None:
+            dataframe, new_entries = encode_categories(dataframe, dictionary)
+
+        para_names = [
+            column for column in dataframe.columns if is_parameter_column(column)
+        ]
+        self._set_wal_mode()
+        # one transaction of batched executemany inserts
+        with self.dbEngine.begin() as connection:
+            if if_exists == "replace":
+                connection.execute(
+                    sql.text(f'DROP TABLE IF EXISTS "{dictionary_table}"')
+                )
+            for column in new_columns:
+                connection.execute(
+                    sql.text(
+                        f'ALTER TABLE "{table}" ADD COLUMN "{column}" '
+                        f"{_sql_type(dataframe[column])}"
+                    )
+                )
+            dataframe.to_sql(
+                name=table,
+                con=connection,
+                index=False,
+                if_exists=if_exists,
+                chunksize=self.chunksize,
+            )
+            if para_names:
+                index_columns = ", ".join(f'"{column}"' for column in para_names)
+                connection.execute(
+                    sql.text(
+                        f'CREATE INDEX IF NOT EXISTS "ix_{table}_parameters" '
+                        f'ON "{table}" ({index_columns})'
+                    )
+                )
+            if new_entries:
+                pd.DataFrame(new_entries, columns=["column", "code", "value"]).to_sql(
+                    name=dictionary_table,
+                    con=connection,
+                    index=False,
+                    if_exists="append",
+                )
+
+    def remove(self, table=None):
+        if table is None:
+            # the pooled connections are closed before the database and the
+            # write-ahead log and shared memory files of WAL mode are deleted
+            self.dbEngine.dispose()
+            for path in (self.path, self.path + "-wal", self.path + "-shm"):
+                if os.path.exists(path):
+                    os.remove(path)
+            return
+
+        super().remove(table)
+        if self.has_table(table + dictionary_suffix):
+            super().remove(table + dictionary_suffix)
+
+
+class SearchDataWriter:
+    # single writer of a storage. Search data is put on a queue, from threads
+    # or, with a multiprocessing queue, from other processes. One thread saves
+    # it in the order it arrives. An error of a save is raised by the next put
+    # or by close, and the search data that is queued after it is not saved.
+
+    def __init__(self, storage, write_queue=None):
+        self.storage = storage
+        self.queue = queue.Queue() if write_queue is None else write_queue
+        self.error = None
+
+        self.thread = threading.Thread(target=self._write, daemon=True)
+        self.thread.start()
+
+    def _write(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            if self.error is not None:
+                continue
+            table, dataframe = item
+            try:
+                self.storage.save(table, dataframe, if_exists="append")
+            except Exception as e:
+                self.error = e
+
+    def _raise_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def put(self, table, dataframe):
+        self._raise_error()
+        self.queue.put((table, dataframe))
+
+    def close(self):
+        # waits until the queued search data is saved
+        self.queue.put(None)
+        self.thread.join()
+        self._raise_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ParquetStorage:
+    # tables are directories of parquet files. Every save with
+    # if_exists="append" adds a file, and loading reads only the projected
+    # columns of the row groups that can match the filters.
+
+    def __init__(self, path, memory_map=True, float32_scores=False):
+        self.path = path
+        self.memory_map = memory_map
+        # parquet already stores strings with dictionary encoding and bit-packs
+        # integers. The scores can be narrowed to float32.
+        self.float32_scores = float32_scores
+        self.conv = SearchDataConverter()
+
+    def table_path(self, table):
+        return os.path.join(self.path, table)
+
+    def has_table(self, table):
+        return os.path.isdir(self.table_path(table))
+
+    @property
+    def tables(self):
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(table for table in os.listdir(self.path) if self.has_table(table))
+
+    def load(self, table, search_space=None, columns=None, filters=None):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self.has_table(table):
+            msg = f"Table '{table}' does not exist in path: {self.path}"
+            raise FileNotFoundError(msg)
+        table_path = self.table_path(table)
+        # e.g. the eval_time column is missing from the files of older saves
+        schema = pa.unify_schemas(
+            [
+                pq.read_schema(os.path.join(table_path, file_name))
+                for file_name in sorted(os.listdir(table_path))
+            ]
+        )
+
+        filters_ = None
+        if filters:
+            filters_ = [
+                (column, "in", _filter_values(values))
+                for column, values in filters.items()
+            ]
+        search_data = pq.read_table(
+            table_path,
+            schema=schema,
+            columns=None if columns is None else list(columns),
+            filters=filters_,
+            memory_map=self.memory_map,
+        ).to_pandas()
+
+        if search_space is not None:
+            search_data = self.conv.str2func(search_data, search_space)
+        return search_data
+
+    def save(self, table, dataframe, if_exists="replace"):
+        if self.has_table(table):
+            if if_exists == "fail":
+                raise ValueError(f"Table '{table}' already exists.")
+            if if_exists == "replace":
+                self.remove(table)
+        table_path = self.table_path(table)
+        os.makedirs(table_path, exist_ok=True)
+
+        dataframe = dataframe.copy()
+        for column in dataframe.columns:
+            if dataframe[column].dtype == object:
+                dataframe[column] = dataframe[column].map(encode_value)
+        if self.float32_scores and "score" in dataframe.columns:
+            dataframe["score"] = dataframe["score"].astype(np.float32)
+
+        # unique names, so concurrent appends do not overwrite each other. The
+        # files are read in the order of their names, that is the save order.
+        file_name = f"part-{time.time_ns():020d}-{uuid.uuid4().hex}.parquet"
+        dataframe.to_parquet(os.path.join(table_path, file_name), index=False)
+
+    def remove(self, table=None):
+        path = self.path if table is None else self.table_path(table)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+
+
+storages = {
+    "sql": SqlStorage,
+    "parquet": ParquetStorage,
+}
@@ -3,23 +3,90 @@
 # License: MIT License
 
 
+import os
+import time
+import itertools
 import numpy as np
 import pandas as pd
 from functools import reduce
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from tqdm import tqdm
 
-from search_data_collector import SqlSearchData
-from hyperactive import Hyperactive
-from hyperactive.optimizers import GridSearchOptimizer as HyperactiveGridSearchOptimizer
 from gradient_free_optimizers import GridSearchOptimizer
 
-from .config import default_search_data_path
+from .config import default_search_data_paths
+from .encoding import encode_value
+from .score_tensor import ScoreTensor
+from .search_data_accumulator import SearchDataAccumulator
+from .storage import storages, SearchDataWriter, non_parameter_columns, metric_prefix
+from ..evaluation_cache import EvaluationCache
 
 
-class SurfacesDataCollector(SqlSearchData):
-    def __init__(self, path=None) -> None:
-        if path is None:
-            path = default_search_data_path
-        super().__init__(path, func2str=True)
+def _metric_record(objective_function, params):
+    # the scores of every metric and the fit and score times, that a test
+    # function with a list of metrics records for the parameters
+    test_function = getattr(objective_function, "__self__", None)
+    metric_records = getattr(test_function, "metric_records", None)
+    if not metric_records:
+        return {}
+    record = metric_records.get(EvaluationCache.create_key(params), {})
+    return {
+        column if column in non_parameter_columns else metric_prefix + column: value
+        for column, value in record.items()
+    }
+
+
+def _timed_evaluation(objective_function, params):
+    start = time.perf_counter()
+    score = objective_function(params)
+    eval_time = time.perf_counter() - start
+    return score, eval_time, _metric_record(objective_function, params)
+
+
+def _timed_evaluations(objective_function, configs):
+    return [
+        (params, *_timed_evaluation(objective_function, params)) for params in configs
+    ]
+
+
+def _add_records(search_data, records):
+    # the columns of the metric records are added to the search data
+    records = pd.DataFrame(records, index=search_data.index)
+    return pd.concat([search_data, records], axis=1)
+
+
+class SurfacesDataCollector:
+    # number of grid points that are evaluated in one vectorized pass
+    grid_chunk_size = 100_000
+
+    def __init__(self, path=None, storage="sql", **storage_params) -> None:
+        # storage is the name of a storage in storages, that is created with
+        # the storage_params, or a storage object
+        if isinstance(storage, str):
+            if storage not in storages:
+                msg = f"Unknown storage '{storage}', choose from {list(storages)}"
+                raise ValueError(msg)
+            if path is None:
+                path = default_search_data_paths[storage]
+            storage = storages[storage](path, **storage_params)
+
+        self.storage = storage
+        self.path = storage.path
+
+    @property
+    def tables(self):
+        return self.storage.tables
+
+    def load(self, table, search_space=None, columns=None, filters=None):
+        return self.storage.load(
+            table, search_space=search_space, columns=columns, filters=filters
+        )
+
+    def save(self, table, dataframe, if_exists="replace"):
+        self.storage.save(table, dataframe, if_exists)
+
+    def remove(self, table=None):
+        self.storage.remove(table)
 
     def _init_search_data(self, objective_function, search_space):
         self.para_names = [key for key in list(search_space.keys())]
@@ -28,51 +95,185 @@ class SurfacesDataCollector(SqlSearchData):
         dim_sizes_list = [len(array) for array in search_space.values()]
         self.search_space_size = reduce((lambda x, y: x * y), dim_sizes_list)
 
-        search_data_cols = self.para_names + ["score"]
+        search_data_cols = self.para_names + ["score", "eval_time"]
         self.search_data = pd.DataFrame([], columns=search_data_cols)
 
-    def _array_search_space(self, objective_function, search_space):
-        while self.search_data_length < self.search_space_size:
+    def _uncollected(self, search_data, collected):
+        # the rows of the configurations, that are not in the table yet
+        if not collected:
+            return search_data
+        para_values = search_data[self.para_names].itertuples(index=False, name=None)
+        is_new = [
+            tuple(encode_value(value) for value in values) not in collected
+            for values in para_values
+        ]
+        return search_data[is_new].reset_index(drop=True)
+
+    def _array_search_space(self, objective_function, search_space, collected):
+        # the evaluation times and metric records are not part of the search
+        # data of the optimizer
+        eval_times = {}
+        records = {}
+
+        def timed_objective_function(para):
+            score, eval_time, record = _timed_evaluation(objective_function, para)
+            key = tuple(para[para_name] for para_name in self.para_names)
+            eval_times[key] = eval_time
+            records[key] = record
+            return score
+
+        search_data = SearchDataAccumulator(self.para_names)
+        while len(search_data) < self.search_space_size:
             opt = GridSearchOptimizer(
                 search_space,
                 direction="orthogonal",
                 initialize={},
             )
             opt.search(
-                objective_function,
+                timed_objective_function,
                 n_iter=int(self.search_space_size * 1),
                 verbosity=["progress_bar"],
             )
 
-            self.search_data = pd.concat(
-                [self.search_data, opt.search_data],
-                ignore_index=True,
-            )
+            # the rows are deduplicated on insertion
+            search_data.add(opt.search_data)
 
-            self.search_data = self.search_data.drop_duplicates(subset=self.para_names)
-            self.search_data_length = len(self.search_data)
+        self.search_data = search_data.to_frame()
+        para_values = list(
+            self.search_data[self.para_names].itertuples(index=False, name=None)
+        )
+        self.search_data["eval_time"] = [
+            eval_times.get(para_value, np.nan) for para_value in para_values
+        ]
+        self.search_data = _add_records(
+            self.search_data,
+            [records.get(para_value, {}) for para_value in para_values],
+        )
+        self.search_data = self._uncollected(self.search_data, collected)
+        self.search_data_length = len(collected) + len(self.search_data)
 
-    def _list_search_space(self, objective_function, search_space):
-        while self.search_data_length < self.search_space_size:
+    @staticmethod
+    def _batch_test_function(objective_function, search_space):
+        # mathematical test functions evaluate a whole array of positions at once
+        test_function = getattr(objective_function, "__self__", None)
+        if not hasattr(test_function, "evaluate_batch") or not hasattr(
+            test_function, "dim_keys"
+        ):
+            return None
+        if set(search_space.keys()) != set(test_function.dim_keys):
+            return None
+        return test_function
 
-            hyper = Hyperactive(verbosity=["progress_bar"])
-            hyper.add_search(
-                objective_function,
-                search_space,
-                initialize={},
-                n_iter=self.search_space_size,
-                optimizer=HyperactiveGridSearchOptimizer(direction="orthogonal"),
-                memory_warm_start=self.search_data,
-            )
-            hyper.run()
+    def _grid_search_space(self, test_function, search_space, collected):
+        # one pass over the cartesian product of the search space, evaluated in
+        # chunks of grid_chunk_size positions. Collected positions are skipped.
+        dim_values = [
+            np.asarray(search_space[dim_key]) for dim_key in test_function.dim_keys
+        ]
+        dim_sizes = tuple(len(values) for values in dim_values)
 
-            self.search_data = pd.concat(
-                [self.search_data, hyper.search_data(objective_function)],
-                ignore_index=True,
+        search_data_chunks = []
+        for start in range(0, self.search_space_size, self.grid_chunk_size):
+            stop = min(start + self.grid_chunk_size, self.search_space_size)
+            positions = np.unravel_index(np.arange(start, stop), dim_sizes)
+
+            X = np.stack(
+                [values[pos] for values, pos in zip(dim_values, positions)], axis=1
+            )
+            search_data_chunk = self._uncollected(
+                pd.DataFrame(X, columns=test_function.dim_keys), collected
             )
+            if search_data_chunk.empty:
+                continue
+            X = search_data_chunk[list(test_function.dim_keys)].to_numpy()
 
-            self.search_data = self.search_data.drop_duplicates(subset=self.para_names)
-            self.search_data_length = len(self.search_data)
+            start_time = time.perf_counter()
+            search_data_chunk["score"] = test_function.evaluate_batch(X)
+            # the time of a vectorized pass is shared by its evaluations
+            eval_time = time.perf_counter() - start_time
+            search_data_chunk["eval_time"] = eval_time / len(X)
+            search_data_chunks.append(search_data_chunk)
+
+        if search_data_chunks:
+            search_data = pd.concat(search_data_chunks, ignore_index=True)
+            self.search_data = search_data[self.para_names + ["score", "eval_time"]]
+        self.search_data_length = len(collected) + len(self.search_data)
+
+    def _collected_configs(self, table):
+        if not self.storage.has_table(table):
+            return set()
+
+        search_data = self.load(table, columns=self.para_names)
+        return set(search_data[self.para_names].itertuples(index=False, name=None))
+
+    def _resumable_search_space(
+        self, objective_function, search_space, table, collected, n_jobs, batch_size
+    ):
+        # only the configurations that are missing from the table are evaluated
+        configs = [
+            dict(zip(self.para_names, values))
+            for values in itertools.product(*search_space.values())
+            if tuple(encode_value(value) for value in values) not in collected
+        ]
+
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+        executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+        # small chunks of configurations keep the workers busy, if the
+        # evaluation times are uneven
+        chunksize = max(1, min(batch_size, len(configs) // (4 * n_jobs)))
+        chunks = [
+            configs[start : start + chunksize]
+            for start in range(0, len(configs), chunksize)
+        ]
+        # shows the evaluations per second and the remaining time
+        progress_bar = tqdm(total=len(configs), desc=table, unit="eval")
+        # the search data is saved by one writer thread, while the evaluations
+        # continue
+        writer = SearchDataWriter(self.storage)
+        futures = []
+        try:
+            # the evaluation time is measured in the process that evaluates
+            if executor is None:
+                results = (
+                    _timed_evaluations(objective_function, chunk) for chunk in chunks
+                )
+            else:
+                futures = [
+                    executor.submit(_timed_evaluations, objective_function, chunk)
+                    for chunk in chunks
+                ]
+                # in the order they finish
+                results = (future.result() for future in as_completed(futures))
+
+            batch = []
+            for chunk_results in results:
+                batch.extend(chunk_results)
+                progress_bar.update(len(chunk_results))
+                # every batch_size evaluations are saved, so an interrupted
+                # collection continues from there
+                if len(batch) >= batch_size:
+                    writer.put(table, self._batch_search_data(batch))
+                    batch = []
+            if batch:
+                writer.put(table, self._batch_search_data(batch))
+        finally:
+            progress_bar.close()
+            if executor is not None:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown()
+            writer.close()
+
+        self.search_data_length = len(collected) + len(configs)
+
+    def _batch_search_data(self, batch):
+        search_data = pd.DataFrame(
+            [params for params, _, _, _ in batch], columns=self.para_names
+        )
+        search_data["score"] = [score for _, score, _, _ in batch]
+        search_data["eval_time"] = [eval_time for _, _, eval_time, _ in batch]
+        return _add_records(search_data, [record for _, _, _, record in batch])
 
     def collect(
         self,
@@ -80,17 +281,38 @@ class SurfacesDataCollector(SqlSearchData):
         search_space,
         table=None,
         if_exists="append",
+        n_jobs=1,
+        batch_size=100,
     ):
         if table is None:
-            table = objective_function.__name__
+            # objective functions of test functions are named after them
+            test_function = getattr(objective_function, "__self__", None)
+            table = getattr(test_function, "_name_", objective_function.__name__)
+
+        # "append" continues a collection in the existing table. The
+        # configurations, that are already in it, are not saved again.
+        if self.storage.has_table(table):
+            if if_exists == "replace":
+                self.remove(table)
+            elif if_exists == "fail":
+                raise ValueError(f"Table '{table}' already exists.")
 
         self._init_search_data(objective_function, search_space)
-        if isinstance(search_space[self.para_names[0]], np.ndarray):
-            self._array_search_space(objective_function, search_space)
+        collected = self._collected_configs(table)
+
+        test_function = self._batch_test_function(objective_function, search_space)
+        if test_function is not None:
+            self._grid_search_space(test_function, search_space, collected)
+        elif isinstance(search_space[self.para_names[0]], np.ndarray):
+            self._array_search_space(objective_function, search_space, collected)
         else:
-            self._list_search_space(objective_function, search_space)
+            self._resumable_search_space(
+                objective_function, search_space, table, collected, n_jobs, batch_size
+            )
+            return
 
-        self.save(table, self.search_data, if_exists)
+        if not self.search_data.empty:
+            self.save(table, self.search_data, if_exists="append")
 
-    def load(self, table):
-        return self.sql_data.load(table)
+    def load_score_tensor(self, table, search_space):
+        return ScoreTensor.from_search_data(self.load(table), search_space)
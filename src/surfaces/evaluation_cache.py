@@ -0,0 +1,97 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+
+import sys
+import numpy as np
+from collections import OrderedDict
+
+
+def _canonical_value(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if callable(value):
+        qualname = getattr(value, "__qualname__", "<")
+        if "<" in qualname:
+            # lambdas and local functions have no unique name
+            return value
+        return ("callable", value.__module__, qualname)
+    return value
+
+
+def _sizeof(obj):
+    if isinstance(obj, tuple):
+        return sys.getsizeof(obj) + sum(_sizeof(item) for item in obj)
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) + obj.nbytes
+    return sys.getsizeof(obj)
+
+
+class EvaluationCache:
+    # least recently used cache of evaluations, keyed on the parameter values
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.entries = OrderedDict()
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def create_key(params):
+        try:
+            para_dict = params.para_dict
+        except AttributeError:
+            para_dict = params
+
+        key = tuple(
+            (para_name, _canonical_value(para_dict[para_name]))
+            for para_name in sorted(para_dict.keys())
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # e.g. arrays of positions can not be cached
+            return None
+        return key
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, default=None):
+        if key is None or key not in self.entries:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key][0]
+
+    def put(self, key, value):
+        if key is None:
+            return
+        if key in self.entries:
+            self.n_bytes -= self.entries.pop(key)[1]
+
+        n_bytes = _sizeof(key) + _sizeof(value)
+        self.entries[key] = (value, n_bytes)
+        self.n_bytes += n_bytes
+
+        while self.entries and (
+            (self.max_entries is not None and len(self.entries) > self.max_entries)
+            or (self.max_bytes is not None and self.n_bytes > self.max_bytes)
+        ):
+            _, (_, n_bytes_) = self.entries.popitem(last=False)
+            self.n_bytes -= n_bytes_
+
+    def clear(self):
+        self.entries.clear()
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
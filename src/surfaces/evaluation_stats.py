@@ -0,0 +1,59 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+
+import numpy as np
+
+
+# upper bucket edges of the latency histogram in seconds: 1us, ~3us, ..., 1000s
+latency_bucket_edges = np.logspace(-6, 3, 19)
+
+_N_CALLS, _LATENCY, _SLEEP, _COMPUTE = range(4)
+
+
+class EvaluationStats:
+    def __init__(self):
+        self.totals = np.zeros(4)
+        self.latency_counts = np.zeros(len(latency_bucket_edges) + 1, dtype=np.int64)
+        self.n_cache_hits = 0
+
+    def record(self, latency, sleep_time, compute_time, n_calls=1):
+        # a batch of n_calls evaluations is counted with its mean latency
+        totals = self.totals
+        totals[_N_CALLS] += n_calls
+        totals[_LATENCY] += latency
+        totals[_SLEEP] += sleep_time
+        totals[_COMPUTE] += compute_time
+
+        bucket = latency_bucket_edges.searchsorted(latency / max(n_calls, 1))
+        self.latency_counts[bucket] += n_calls
+
+    def record_cache_hit(self, latency):
+        self.n_cache_hits += 1
+        self.record(latency, 0, 0)
+
+    def merge(self, stats):
+        # e.g. the stats of the evaluations in a worker process
+        self.totals += stats.totals
+        self.latency_counts += stats.latency_counts
+        self.n_cache_hits += stats.n_cache_hits
+
+    def reset(self):
+        self.totals[:] = 0
+        self.latency_counts[:] = 0
+        self.n_cache_hits = 0
+
+    def snapshot(self):
+        n_calls, latency, sleep_time, compute_time = self.totals.tolist()
+        return {
+            "n_calls": int(n_calls),
+            "n_cache_hits": self.n_cache_hits,
+            "total_latency": latency,
+            "mean_latency": latency / n_calls if n_calls else 0.0,
+            "sleep_time": sleep_time,
+            "compute_time": compute_time,
+            "throughput": n_calls / latency if latency else 0.0,
+            "latency_bucket_edges": latency_bucket_edges.tolist(),
+            "latency_counts": self.latency_counts.tolist(),
+        }
@@ -4,7 +4,16 @@
 
 from .mathematical import mathematical_functions
 
-from .machine_learning import machine_learning_functions
 
+def __getattr__(name):
+    # the machine learning functions import sklearn, pandas and the search
+    # data collector. They are imported on first access.
+    if name == "machine_learning_functions":
+        from .machine_learning import machine_learning_functions
 
-test_functions: list = mathematical_functions + machine_learning_functions
+        return machine_learning_functions
+    if name == "test_functions":
+        from .machine_learning import machine_learning_functions
+
+        return mathematical_functions + machine_learning_functions
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
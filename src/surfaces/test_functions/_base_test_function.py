@@ -3,6 +3,11 @@
 # License: MIT License
 
 import time
+import asyncio
+import numpy as np
+
+
+_not_cached = object()
 
 
 class BaseTestFunction:
@@ -15,13 +20,22 @@ class BaseTestFunction:
     objective_function: callable
     pure_objective_function: callable
 
+    # the simulated evaluation time is spent on this clock. Replace it with a
+    # VirtualClock to accumulate the time instead of blocking.
+    clock = time
+    # opt-in EvaluationCache, that stores the metric of evaluated parameters
+    cache = None
+    # opt-in EvaluationStats, that records the calls and their latencies
+    evaluation_stats = None
+
+    # attributes that hold closures or connections. They are rebuilt on
+    # unpickle instead of being pickled.
+    _rebuilt_attributes = ("pure_objective_function", "_objective_function_")
+
     def create_objective_function_(function):
         def wrapper(self, *args, **kwargs):
             function(self, *args, **kwargs)
             self.create_objective_function()
-            self.objective_function.__func__.__name__ = (
-                self.pure_objective_function.__name__
-            )
 
         return wrapper
 
@@ -38,6 +52,17 @@ class BaseTestFunction:
         e_msg = "'search_space'-method is not implemented"
         raise NotImplementedError(e_msg)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for attribute in self._rebuilt_attributes:
+            state.pop(attribute, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.create_objective_function()
+        self._objective_function_ = self.pure_objective_function
+
     def return_metric(self, metric):
         return metric
 
@@ -45,8 +70,99 @@ class BaseTestFunction:
         para = {f"x{i}": arg for i, arg in enumerate(args)}
         return self._objective_function_(para)
 
+    def stats(self):
+        if self.evaluation_stats is None:
+            return None
+        return self.evaluation_stats.snapshot()
+
+    def reset_stats(self):
+        if self.evaluation_stats is not None:
+            self.evaluation_stats.reset()
+
+    def evaluate(self, *input):
+        if self.evaluation_stats is not None:
+            return self._evaluate_recorded(self._objective_function_, input, self.sleep)
+
+        if self.sleep:
+            self.clock.sleep(self.sleep)
+
+        return self._objective_function_(*input)
+
+    def _evaluate_with_sleep(self, function, input, sleep):
+        # evaluates function(*input) after the simulated cost sleep, e.g. of a
+        # batch of evaluations
+        if self.evaluation_stats is not None:
+            return self._evaluate_recorded(function, input, sleep)
+
+        if sleep:
+            self.clock.sleep(sleep)
+        return function(*input)
+
+    def _evaluate_recorded(self, function, input, sleep):
+        start = time.perf_counter()
+        if sleep:
+            self.clock.sleep(sleep)
+
+        start_compute = time.perf_counter()
+        metric = function(*input)
+        end = time.perf_counter()
+
+        # an array of metrics is recorded as one call per position
+        self.evaluation_stats.record(
+            end - start, sleep, end - start_compute, np.size(metric)
+        )
+        return metric
+
+    def _cache_get(self, key):
+        if self.evaluation_stats is None:
+            return self.cache.get(key, _not_cached)
+
+        start = time.perf_counter()
+        metric = self.cache.get(key, _not_cached)
+        if metric is not _not_cached:
+            self.evaluation_stats.record_cache_hit(time.perf_counter() - start)
+        return metric
+
     def objective_function(self, *input):
-        time.sleep(self.sleep)
+        if self.cache is None:
+            return self.return_metric(self.evaluate(*input))
+
+        key = self.cache.create_key(*input)
+        metric = self._cache_get(key)
+        if metric is _not_cached:
+            metric = self.evaluate(*input)
+            self._cache_metric(key, metric)
+        return self.return_metric(metric)
+
+    def _cache_metric(self, key, metric):
+        # partial evaluations, like a PrunedScore, are not cached, so the next
+        # call evaluates the parameters completely
+        if not getattr(metric, "pruned", False):
+            self.cache.put(key, metric)
+
+    async def pure_objective_function_async(self, *input):
+        return self._objective_function_(*input)
+
+    async def objective_function_async(self, *input):
+        if self.cache is not None:
+            key = self.cache.create_key(*input)
+            metric = self._cache_get(key)
+            if metric is not _not_cached:
+                return self.return_metric(metric)
+
+        start = time.perf_counter()
+        if self.sleep:
+            if self.clock is time:
+                await asyncio.sleep(self.sleep)
+            else:
+                self.clock.sleep(self.sleep)
+
+        start_compute = time.perf_counter()
+        metric = await self.pure_objective_function_async(*input)
+        if self.evaluation_stats is not None:
+            end = time.perf_counter()
+            self.evaluation_stats.record(end - start, self.sleep, end - start_compute)
 
-        metric = self.pure_objective_function(*input)
+        if self.cache is not None:
+            self._cache_metric(key, metric)
         return self.return_metric(metric)
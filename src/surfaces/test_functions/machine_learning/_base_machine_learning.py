@@ -2,44 +2,233 @@
 # Email: simon.blanke@yahoo.com
 # License: MIT License
 
+import os
+import time
+import atexit
+import asyncio
 import numpy as np
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-from .._base_test_function import BaseTestFunction
-from ...data_collector import SurfacesDataCollector
+from .._base_test_function import BaseTestFunction, _not_cached
+from ...evaluation_stats import EvaluationStats
+from ...data_collector.encoding import encode_value
+
+
+# persistent worker pools of evaluate_many: (test function class, n_jobs) -> pool
+_process_pools = {}
+
+
+def _init_worker(datasets):
+    from .tabular.datasets import get_dataset
+
+    # load the datasets once per worker instead of once per evaluation
+    for dataset in datasets:
+        get_dataset(dataset)
+
+
+def _evaluate_in_worker(test_function, params):
+    # the stats of the evaluation are returned to the calling process
+    if test_function.evaluation_stats is not None:
+        test_function.evaluation_stats = EvaluationStats()
+    metric = test_function.evaluate(params)
+    return metric, test_function.evaluation_stats
 
 
 class MachineLearningFunction(BaseTestFunction):
+    # bounded executor of objective_function_async, shared by all instances
+    # unless it is replaced on a class or instance
+    executor = None
+    max_async_workers = os.cpu_count()
+    # opt-in ScoreTensor, that replaces the search data table of
+    # evaluate_from_data
+    score_tensor = None
+    # opt-in: evaluate_from_data spends the evaluation time, that was measured
+    # during the collection, on the clock. With a VirtualClock the time is
+    # charged instead of slept.
+    replay_eval_time = False
+
+    # the connection to the search data is reopened and the index is rebuilt
+    _rebuilt_attributes = BaseTestFunction._rebuilt_attributes + (
+        "sdc",
+        "search_data_index",
+        "eval_time_index",
+    )
+
     def __init__(self, *args, sleep=0, evaluate_from_data=False, **kwargs):
         super().__init__(*args, sleep, **kwargs)
 
-        if evaluate_from_data:
+        self.evaluate_from_data = evaluate_from_data
+        self.init_evaluate_from_data()
+
+    def init_evaluate_from_data(self):
+        # the search data is loaded on the first evaluation
+        self.search_data_index = None
+        self.eval_time_index = None
+        if self.evaluate_from_data:
+            from ...data_collector import SurfacesDataCollector
+
             self.sdc = SurfacesDataCollector()
             self._objective_function_ = self.objective_function_loaded
         else:
             self._objective_function_ = self.pure_objective_function
 
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.init_evaluate_from_data()
+
+    def get_executor(self):
+        if self.executor is None:
+            MachineLearningFunction.executor = ThreadPoolExecutor(
+                max_workers=self.max_async_workers
+            )
+        return self.executor
+
+    def get_process_pool(self, n_jobs):
+        key = (type(self), n_jobs)
+        if key not in _process_pools:
+            _process_pools[key] = ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_worker,
+                initargs=(tuple(self.dataset_default),),
+            )
+        return _process_pools[key]
+
+    @staticmethod
+    def shutdown_process_pools():
+        # the workers of evaluate_many are started again by the next call
+        for process_pool in _process_pools.values():
+            process_pool.shutdown()
+        _process_pools.clear()
+
+    def evaluate_many(self, list_of_params, n_jobs=-1):
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+        if n_jobs == 1:
+            return [self.objective_function(params) for params in list_of_params]
+
+        # only the parameters that are not cached are sent to the workers
+        metrics = [_not_cached] * len(list_of_params)
+        keys = [None] * len(list_of_params)
+        if self.cache is not None:
+            for i, params in enumerate(list_of_params):
+                keys[i] = self.cache.create_key(params)
+                metrics[i] = self._cache_get(keys[i])
+        missing = [i for i, metric in enumerate(metrics) if metric is _not_cached]
+
+        # a virtual clock is copied into the workers, so the simulated cost
+        # is charged to the clock of this process as well
+        if self.sleep and self.clock is not time:
+            self.clock.sleep(self.sleep * len(missing))
+
+        # the test function is pickled once per chunk instead of per evaluation
+        chunksize = -(-len(missing) // n_jobs)
+        process_pool = self.get_process_pool(n_jobs)
+        try:
+            results = process_pool.map(
+                _evaluate_in_worker,
+                [self.worker_copy()] * len(missing),
+                [list_of_params[i] for i in missing],
+                chunksize=max(chunksize, 1),
+            )
+            for i, (metric, evaluation_stats) in zip(missing, results):
+                if evaluation_stats is not None:
+                    self.evaluation_stats.merge(evaluation_stats)
+                if self.cache is not None:
+                    self._cache_metric(keys[i], metric)
+                metrics[i] = metric
+        except BrokenProcessPool:
+            # a crashed worker breaks the pool, the next call starts a new one
+            _process_pools.pop((type(self), n_jobs), None)
+            process_pool.shutdown(wait=False)
+            raise
+        return [self.return_metric(metric) for metric in metrics]
+
+    def worker_copy(self):
+        # the workers neither read nor fill the cache, so it is left out of
+        # the pickled chunks
+        test_function = object.__new__(type(self))
+        test_function.__dict__.update(self.__dict__)
+        test_function.cache = None
+        if self.evaluation_stats is not None:
+            test_function.evaluation_stats = EvaluationStats()
+        return test_function
+
+    def evaluate_batch(self, list_of_params):
+        # the simulated cost of all evaluations is paid in one call
+        scores = self._evaluate_with_sleep(
+            self._evaluate_batch, (list_of_params,), self.sleep * len(list_of_params)
+        )
+        return self.return_metric(scores)
+
+    def _evaluate_batch(self, list_of_params):
+        if self.evaluate_from_data and self.score_tensor is not None:
+            return self.score_tensor.lookup(list_of_params)
+        return np.array(
+            [self._objective_function_(params) for params in list_of_params]
+        )
+
+    async def pure_objective_function_async(self, *input):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.get_executor(), self._objective_function_, *input
+        )
+
+    def create_search_data_index(self):
+        search_data = self.sdc.load(self._name_)
+        if search_data is None or len(search_data) == 0:
+            msg = f"Search data of '{self._name_}' is empty"
+            raise TypeError(msg)
+
+        para_values = list(
+            search_data[self.para_names].itertuples(index=False, name=None)
+        )
+        # search data that was collected without the evaluation times has no
+        # eval_time column
+        if "eval_time" in search_data.columns:
+            self.eval_time_index = dict(
+                zip(para_values, search_data["eval_time"].values)
+            )
+        return dict(zip(para_values, search_data["score"].values))
+
     def objective_function_loaded(self, params):
         try:
             parameter_d = params.para_dict
         except AttributeError:
             parameter_d = params
 
-        for para_names, dim_value in parameter_d.items():
-            try:
-                parameter_d[para_names] = dim_value.__name__
-            except AttributeError:
-                pass
+        if self.score_tensor is not None:
+            # the score tensor holds no evaluation times to replay
+            return self.score_tensor.lookup([parameter_d])[0]
 
-        search_data = self.sdc.load(self.__name__)
-        if search_data is None:
-            msg = "Search Data is empty"
-            raise TypeError(msg)
+        if self.search_data_index is None:
+            self.search_data_index = self.create_search_data_index()
 
-        params_df = pd.DataFrame(parameter_d, index=[0])
+        key = tuple(
+            encode_value(parameter_d[para_name]) for para_name in self.para_names
+        )
+        try:
+            score = self.search_data_index[key]
+        except KeyError:
+            msg = (
+                f"Parameters {dict(zip(self.para_names, key))} are not in the "
+                f"search data of '{self._name_}'"
+            )
+            raise KeyError(msg) from None
 
-        para_df_row = search_data[
-            np.all(search_data[self.para_names].values == params_df.values, axis=1)
-        ]
-        score = para_df_row["score"].values[0]
+        if self.replay_eval_time:
+            self.replay(key)
         return score
+
+    def replay(self, key):
+        if self.eval_time_index is None:
+            msg = f"Search data of '{self._name_}' has no evaluation times"
+            raise ValueError(msg)
+
+        eval_time = self.eval_time_index[key]
+        # rows of older collections can miss the evaluation time
+        if not np.isnan(eval_time):
+            self.clock.sleep(eval_time)
+
+
+atexit.register(MachineLearningFunction.shutdown_process_pools)
@@ -3,9 +3,218 @@
 # License: MIT License
 
 
+import math
+import numpy as np
+from sklearn.base import is_classifier
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import cross_validate
+
 from .._base_machine_learning import MachineLearningFunction
+from ....evaluation_cache import EvaluationCache
+from .datasets import get_dataset
+from ._cross_validation import cv_folds
+from .pruning import PrunedScore
 
 
 class BaseTabular(MachineLearningFunction):
+    # how a fidelity below 1 reduces the cost of objective_function_fidelity:
+    # "folds" evaluates a part of the cv folds, "samples" trains on a part of
+    # each training fold
+    fidelity_mode = "folds"
+    fidelity_modes = ("folds", "samples")
+    # opt-in callable pruner(params, fold, scores) -> bool, that is called
+    # after every cv fold with the scores so far. If it returns True, the
+    # remaining folds are skipped and a PrunedScore is returned.
+    pruner = None
+    # the records of the last max_metric_records parameters are kept
+    max_metric_records = 10_000
+    # the scores of the last max_fold_scores folds are kept
+    max_fold_scores = 10_000
+    # opt-in attributes of subclasses, that score only the primary metric
+    single_metric_options = ()
+
+    # the scores of the folds and metrics are kept per process. They are not
+    # pickled, e.g. with every chunk of evaluate_many.
+    _rebuilt_attributes = MachineLearningFunction._rebuilt_attributes + (
+        "fold_scores",
+        "metric_records",
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+
+        # (parameters, metric, fold, fraction of training samples) -> score of
+        # the fold
+        self.fold_scores = {}
+        # parameters -> scores of every metric and the fit and score times, of
+        # the evaluations in this process
+        self.metric_records = {}
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.fold_scores = {}
+        self.metric_records = {}
+
+    @property
+    def primary_metric(self):
+        # of a list of metrics, the first one is returned by objective_function
+        if isinstance(self.metric, (list, tuple)):
+            return self.metric[0]
+        return self.metric
+
+    def init_evaluate_from_data(self):
+        super().init_evaluate_from_data()
+        if not self.evaluate_from_data:
+            self._objective_function_ = self.objective_function_folds
+
+    def create_model(self, params):
+        e_msg = "'create_model'-method is not implemented"
+        raise NotImplementedError(e_msg)
+
+    def fidelity_params(self, params, fidelity):
+        # the parameters that are evaluated at the fidelity
+        return params
+
+    def min_train_samples(self, params, y):
+        # the fewest training samples, the model of the parameters is fit on
+        if is_classifier(self.create_model(params)):
+            return len(np.unique(y))
+        return 1
+
+    def fold_score(self, params, fold, train, test, sample_fraction):
+        key = (
+            EvaluationCache.create_key(params),
+            self.primary_metric,
+            fold,
+            sample_fraction,
+        )
+        if key in self.fold_scores:
+            return self.fold_scores[key]
+
+        X, y = get_dataset(params["dataset"])
+        if sample_fraction < 1:
+            # the samples of a smaller fraction are part of every larger one
+            n_samples = max(
+                self.min_train_samples(params, y[train]),
+                int(len(train) * sample_fraction),
+            )
+            train = np.random.default_rng(0).permutation(train)[:n_samples]
+
+        model = self.create_model(params).fit(X[train], y[train])
+        score = get_scorer(self.primary_metric)(model, X[test], y[test])
+        self.fold_scores[key] = score
+        if len(self.fold_scores) > self.max_fold_scores:
+            # the oldest score is dropped
+            del self.fold_scores[next(iter(self.fold_scores))]
+        return score
+
+    def cv_folds(self, params):
+        X, y = get_dataset(params["dataset"])
+        model = self.create_model(params)
+        return cv_folds(X, y, params["cv"], is_classifier(model))
+
+    @staticmethod
+    def _raise_single_metric_error(option):
+        msg = (
+            f"'{option}' scores a single metric and can not be combined "
+            f"with a list of metrics"
+        )
+        raise ValueError(msg)
+
+    def evaluate_metrics(self, params, metrics=None):
+        try:
+            params = params.para_dict
+        except AttributeError:
+            pass
+
+        if metrics is None:
+            metrics = self.metric
+        if isinstance(metrics, str):
+            metrics = [metrics]
+        for option in self.single_metric_options:
+            if getattr(self, option):
+                self._raise_single_metric_error(option)
+
+        # all metrics are scored on the same fitted fold models
+        X, y = get_dataset(params["dataset"])
+        results = cross_validate(
+            self.create_model(params), X, y, cv=params["cv"], scoring=list(metrics)
+        )
+
+        record = {metric: results[f"test_{metric}"].mean() for metric in metrics}
+        record["fit_time"] = results["fit_time"].sum()
+        record["score_time"] = results["score_time"].sum()
+
+        key = EvaluationCache.create_key(params)
+        self.metric_records.pop(key, None)
+        self.metric_records[key] = record
+        if len(self.metric_records) > self.max_metric_records:
+            # the oldest record is dropped
+            del self.metric_records[next(iter(self.metric_records))]
+        return record
+
+    def objective_function_folds(self, params):
+        if self.pruner is None:
+            if isinstance(self.metric, (list, tuple)):
+                return self.evaluate_metrics(params)[self.primary_metric]
+            return self.pure_objective_function(params)
+        if isinstance(self.metric, (list, tuple)):
+            self._raise_single_metric_error("pruner")
+
+        try:
+            params = params.para_dict
+        except AttributeError:
+            pass
+
+        folds = self.cv_folds(params)
+        scores = []
+        for fold, (train, test) in enumerate(folds):
+            scores.append(self.fold_score(params, fold, train, test, 1))
+            if fold + 1 < len(folds) and self.pruner(params, fold, scores):
+                return PrunedScore(np.mean(scores), len(scores), len(folds))
+        return np.mean(scores)
+
+    def evaluate_fidelity(self, params, fidelity):
+        try:
+            params = params.para_dict
+        except AttributeError:
+            pass
+
+        if self.evaluate_from_data:
+            # the search data only holds evaluations at full fidelity
+            return self._objective_function_(params)
+
+        params = self.fidelity_params(params, fidelity)
+        folds = self.cv_folds(params)
+
+        sample_fraction = 1
+        if self.fidelity_mode == "folds":
+            # the folds of a lower fidelity are reused at a higher one
+            folds = folds[: max(1, math.ceil(fidelity * len(folds)))]
+        elif self.fidelity_mode == "samples":
+            sample_fraction = fidelity
+
+        scores = [
+            self.fold_score(params, fold, train, test, sample_fraction)
+            for fold, (train, test) in enumerate(folds)
+        ]
+        return np.mean(scores)
+
+    def objective_function_fidelity(self, params, fidelity=1):
+        if not 0 < fidelity <= 1:
+            msg = f"fidelity must be in (0, 1], got {fidelity}"
+            raise ValueError(msg)
+        if self.fidelity_mode not in self.fidelity_modes:
+            msg = (
+                f"Unknown fidelity_mode '{self.fidelity_mode}', "
+                f"choose from {list(self.fidelity_modes)}"
+            )
+            raise ValueError(msg)
+        if isinstance(self.metric, (list, tuple)):
+            self._raise_single_metric_error("objective_function_fidelity")
+
+        # the simulated cost scales with the fidelity
+        metric = self._evaluate_with_sleep(
+            self.evaluate_fidelity, (params, fidelity), self.sleep * fidelity
+        )
+        return self.return_metric(metric)
@@ -0,0 +1,10 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+from sklearn.model_selection import check_cv
+
+
+def cv_folds(X, y, cv, classifier):
+    # the same folds as cross_val_score
+    return list(check_cv(cv, y, classifier=classifier).split(X, y))
@@ -0,0 +1,32 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin
+
+
+# estimators that return predictions that were computed before, so the sklearn
+# scorers can be used on them
+
+
+class PredictedClassifier(ClassifierMixin, BaseEstimator):
+    def __init__(self, classes, proba):
+        self.classes = classes
+        self.proba = proba
+        self.classes_ = classes
+
+    def predict_proba(self, X):
+        return self.proba
+
+    def predict(self, X):
+        # the first of equally frequent classes wins, like in KNeighborsClassifier
+        return self.classes[np.argmax(self.proba, axis=1)]
+
+
+class PredictedRegressor(RegressorMixin, BaseEstimator):
+    def __init__(self, prediction):
+        self.prediction = prediction
+
+    def predict(self, X):
+        return self.prediction
@@ -2,21 +2,16 @@
 # Email: simon.blanke@yahoo.com
 # License: MIT License
 
-from sklearn.datasets import load_digits, load_wine, load_iris
-
-
-digits_dataset = load_digits()
-wine_dataset = load_wine()
-iris_dataset = load_iris()
+from ..datasets import load_dataset
 
 
 def digits_data():
-    return digits_dataset.data, digits_dataset.target
+    return load_dataset("digits_data")
 
 
 def wine_data():
-    return wine_dataset.data, wine_dataset.target
+    return load_dataset("wine_data")
 
 
 def iris_data():
-    return iris_dataset.data, iris_dataset.target
+    return load_dataset("iris_data")
@@ -3,7 +3,8 @@ import numpy as np
 from sklearn.neighbors import KNeighborsClassifier
 
 from sklearn.model_selection import cross_val_score
-from ..datasets import digits_data, wine_data, iris_data
+from ...datasets import get_dataset
+from ...neighbor_graph import get_neighbor_graph
 
 from .._base_classification import BaseClassification
 
@@ -18,7 +19,12 @@ class KNeighborsClassifierFunction(BaseClassification):
     n_neighbors_default = list(np.arange(3, 150, 5))
     algorithm_default = ["auto", "ball_tree", "kd_tree", "brute"]
     cv_default = [2, 3, 4, 5, 8, 10]
-    dataset_default = [digits_data, wine_data, iris_data]
+    dataset_default = ["digits_data", "wine_data", "iris_data"]
+
+    # opt-in: the neighbors of every cv fold are searched once up to the
+    # largest n_neighbors and shared by all smaller values
+    reuse_neighbor_graph = False
+    single_metric_options = ("reuse_neighbor_graph",)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -43,14 +49,36 @@ class KNeighborsClassifierFunction(BaseClassification):
 
         return search_space
 
+    def create_model(self, params):
+        return KNeighborsClassifier(
+            n_neighbors=params["n_neighbors"],
+            algorithm=params["algorithm"],
+        )
+
+    def min_train_samples(self, params, y):
+        return max(params["n_neighbors"], super().min_train_samples(params, y))
+
     def create_objective_function(self):
         def k_neighbors_classifier(params):
-            knc = KNeighborsClassifier(
-                n_neighbors=params["n_neighbors"],
-                algorithm=params["algorithm"],
+            if self.reuse_neighbor_graph:
+                return self.neighbor_graph_score(params)
+
+            knc = self.create_model(params)
+            X, y = get_dataset(params["dataset"])
+            scores = cross_val_score(
+                knc, X, y, cv=params["cv"], scoring=self.primary_metric
             )
-            X, y = params["dataset"]()
-            scores = cross_val_score(knc, X, y, cv=params["cv"], scoring=self.metric)
             return scores.mean()
 
         self.pure_objective_function = k_neighbors_classifier
+
+    def neighbor_graph_score(self, params):
+        max_k = max(max(self.n_neighbors_default), params["n_neighbors"])
+        neighbor_graph = get_neighbor_graph(
+            params["dataset"],
+            params["cv"],
+            max_k,
+            algorithm=params["algorithm"],
+            classifier=True,
+        )
+        return neighbor_graph.score(params["n_neighbors"], self.primary_metric)
@@ -0,0 +1,86 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+import os
+import numpy as np
+
+
+def _load_digits():
+    from sklearn.datasets import load_digits
+
+    return load_digits(return_X_y=True)
+
+
+def _load_wine():
+    from sklearn.datasets import load_wine
+
+    return load_wine(return_X_y=True)
+
+
+def _load_iris():
+    from sklearn.datasets import load_iris
+
+    return load_iris(return_X_y=True)
+
+
+def _load_diabetes():
+    from sklearn.datasets import load_diabetes
+
+    return load_diabetes(return_X_y=True)
+
+
+# name -> function that returns the arrays (X, y) of the dataset
+dataset_loaders = {
+    "digits_data": _load_digits,
+    "wine_data": _load_wine,
+    "iris_data": _load_iris,
+    "diabetes_data": _load_diabetes,
+}
+# datasets loaded in this process
+_datasets = {}
+# optional directory of .npy files, that are memory-mapped instead of
+# loading the datasets again in every process
+_cache_dir = None
+
+
+def register_dataset(name, loader):
+    dataset_loaders[name] = loader
+    _datasets.pop(name, None)
+
+
+def set_cache_dir(cache_dir):
+    global _cache_dir
+    _cache_dir = cache_dir
+    _datasets.clear()
+
+
+def _load_cached(name):
+    paths = [os.path.join(_cache_dir, f"{name}_{array}.npy") for array in "Xy"]
+    if not all(os.path.isfile(path) for path in paths):
+        os.makedirs(_cache_dir, exist_ok=True)
+        for path, array in zip(paths, dataset_loaders[name]()):
+            np.save(path, np.asarray(array))
+
+    X, y = (np.load(path, mmap_mode="r") for path in paths)
+    return X, y
+
+
+def load_dataset(name):
+    if name not in _datasets:
+        if name not in dataset_loaders:
+            msg = f"Unknown dataset '{name}', choose from {list(dataset_loaders)}"
+            raise ValueError(msg)
+
+        if _cache_dir is None:
+            _datasets[name] = tuple(dataset_loaders[name]())
+        else:
+            _datasets[name] = _load_cached(name)
+    return _datasets[name]
+
+
+def get_dataset(dataset):
+    # datasets are passed by their registered name or as a function
+    if callable(dataset):
+        return dataset()
+    return load_dataset(dataset)
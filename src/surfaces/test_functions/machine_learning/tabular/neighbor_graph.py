@@ -0,0 +1,88 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+import numpy as np
+from collections import OrderedDict
+from sklearn.metrics import get_scorer
+from sklearn.neighbors import NearestNeighbors
+
+from .datasets import get_dataset
+from ._cross_validation import cv_folds
+from ._predicted_estimators import PredictedClassifier, PredictedRegressor
+
+
+# (dataset, cv, classifier) -> NeighborGraph of this process, in the order
+# they were used
+_neighbor_graphs = OrderedDict()
+# the least recently used graph is dropped above this number of graphs
+max_neighbor_graphs = 8
+
+
+class NeighborGraph:
+    # sorted neighbors of the test samples of every cross-validation fold, up
+    # to the largest k. The neighbor targets are summed up along the neighbor
+    # axis, so the uniform-weight prediction of every smaller k is one slice.
+
+    def __init__(self, X, y, cv, max_k, algorithm="auto", classifier=True):
+        self.X = X
+        self.y = y
+        self.max_k = max_k
+        self.classifier = classifier
+
+        if classifier:
+            self.classes, y_encoded = np.unique(y, return_inverse=True)
+            targets = np.eye(len(self.classes))[y_encoded]
+        else:
+            targets = np.asarray(y, dtype=float)
+
+        self.folds = []
+        for train, test in cv_folds(X, y, cv, classifier):
+            nearest_neighbors = NearestNeighbors(
+                n_neighbors=min(max_k, len(train)), algorithm=algorithm
+            ).fit(X[train])
+            neighbors = nearest_neighbors.kneighbors(X[test], return_distance=False)
+            cum_targets = np.cumsum(targets[train][neighbors], axis=1)
+            self.folds.append((test, cum_targets))
+
+    def predictor(self, cum_targets, k):
+        if self.classifier:
+            return PredictedClassifier(self.classes, cum_targets[:, k - 1] / k)
+        return PredictedRegressor(cum_targets[:, k - 1] / k)
+
+    def score(self, k, scoring):
+        scorer = get_scorer(scoring)
+
+        scores = []
+        for test, cum_targets in self.folds:
+            if k > cum_targets.shape[1]:
+                msg = (
+                    f"Expected n_neighbors <= n_samples_fit, but "
+                    f"n_samples_fit = {cum_targets.shape[1]}, n_neighbors = {k}"
+                )
+                raise ValueError(msg)
+            predictor = self.predictor(cum_targets, k)
+            scores.append(scorer(predictor, self.X[test], self.y[test]))
+        return np.mean(scores)
+
+
+def get_neighbor_graph(dataset, cv, max_k, algorithm="auto", classifier=True):
+    # the neighbors do not depend on the algorithm, that searches them
+    key = (getattr(dataset, "__name__", dataset), cv, classifier)
+
+    neighbor_graph = _neighbor_graphs.get(key)
+    if neighbor_graph is None or neighbor_graph.max_k < max_k:
+        X, y = get_dataset(dataset)
+        neighbor_graph = NeighborGraph(
+            np.asarray(X), np.asarray(y), cv, max_k, algorithm, classifier
+        )
+        _neighbor_graphs[key] = neighbor_graph
+
+    _neighbor_graphs.move_to_end(key)
+    while len(_neighbor_graphs) > max_neighbor_graphs:
+        _neighbor_graphs.popitem(last=False)
+    return neighbor_graph
+
+
+def clear_neighbor_graphs():
+    _neighbor_graphs.clear()
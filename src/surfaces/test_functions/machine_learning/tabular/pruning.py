@@ -0,0 +1,24 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+
+class PrunedScore(float):
+    # mean score of the folds that were evaluated before the pruner stopped the
+    # cross-validation
+    pruned = True
+
+    def __new__(cls, score, n_folds, n_folds_total):
+        pruned_score = super().__new__(cls, score)
+        pruned_score.n_folds = n_folds
+        pruned_score.n_folds_total = n_folds_total
+        return pruned_score
+
+    def __reduce__(self):
+        return (type(self), (float(self), self.n_folds, self.n_folds_total))
+
+    def __repr__(self):
+        return (
+            f"PrunedScore({float(self)!r}, "
+            f"n_folds={self.n_folds}, n_folds_total={self.n_folds_total})"
+        )
@@ -2,11 +2,8 @@
 # Email: simon.blanke@yahoo.com
 # License: MIT License
 
-from sklearn.datasets import load_diabetes
-
-
-diabetes_dataset = load_diabetes()
+from ..datasets import load_dataset
 
 
 def diabetes_data():
-    return diabetes_dataset.data, diabetes_dataset.target
+    return load_dataset("diabetes_data")
@@ -8,7 +8,8 @@ import numpy as np
 from sklearn.ensemble import GradientBoostingRegressor
 
 from sklearn.model_selection import cross_val_score
-from ..datasets import diabetes_data
+from ...datasets import get_dataset
+from ...staged_boosting import get_staged_scores
 
 from .._base_regression import BaseRegression
 
@@ -23,7 +24,14 @@ class GradientBoostingRegressorFunction(BaseRegression):
     n_estimators_default = list(np.arange(3, 150, 5))
     max_depth_default = list(np.arange(2, 25))
     cv_default = [2, 3, 4, 5, 8, 10]
-    dataset_default = [diabetes_data]
+    dataset_default = ["diabetes_data"]
+
+    # opt-in: one model per cv fold is fitted with the largest n_estimators.
+    # Its stages score all smaller values of n_estimators.
+    staged_n_estimators = False
+    single_metric_options = ("staged_n_estimators",)
+    # "stages" evaluates the fidelity fraction of n_estimators
+    fidelity_modes = BaseRegression.fidelity_modes + ("stages",)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -48,14 +56,39 @@ class GradientBoostingRegressorFunction(BaseRegression):
 
         return search_space
 
+    def create_model(self, params):
+        return GradientBoostingRegressor(
+            n_estimators=params["n_estimators"],
+            max_depth=params["max_depth"],
+        )
+
+    def fidelity_params(self, params, fidelity):
+        if self.fidelity_mode != "stages":
+            return params
+        n_estimators = max(1, round(fidelity * params["n_estimators"]))
+        return {**params, "n_estimators": n_estimators}
+
     def create_objective_function(self):
         def gradient_boosting_regressor(params):
-            knc = GradientBoostingRegressor(
-                n_estimators=params["n_estimators"],
-                max_depth=params["max_depth"],
+            if self.staged_n_estimators:
+                return self.staged_score(params)
+
+            knc = self.create_model(params)
+            X, y = get_dataset(params["dataset"])
+            scores = cross_val_score(
+                knc, X, y, cv=params["cv"], scoring=self.primary_metric
             )
-            X, y = params["dataset"]()
-            scores = cross_val_score(knc, X, y, cv=params["cv"], scoring=self.metric)
             return scores.mean()
 
         self.pure_objective_function = gradient_boosting_regressor
+
+    def staged_score(self, params):
+        max_n_estimators = max(max(self.n_estimators_default), params["n_estimators"])
+        staged_scores = get_staged_scores(
+            params["dataset"],
+            params["cv"],
+            params["max_depth"],
+            max_n_estimators,
+            self.primary_metric,
+        )
+        return staged_scores[params["n_estimators"] - 1]
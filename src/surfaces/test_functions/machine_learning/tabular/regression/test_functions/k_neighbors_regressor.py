@@ -8,7 +8,8 @@ import numpy as np
 from sklearn.neighbors import KNeighborsRegressor
 
 from sklearn.model_selection import cross_val_score
-from ..datasets import diabetes_data
+from ...datasets import get_dataset
+from ...neighbor_graph import get_neighbor_graph
 
 from .._base_regression import BaseRegression
 
@@ -23,7 +24,12 @@ class KNeighborsRegressorFunction(BaseRegression):
     n_neighbors_default = list(np.arange(3, 150, 5))
     algorithm_default = ["auto", "ball_tree", "kd_tree", "brute"]
     cv_default = [2, 3, 4, 5, 8, 10]
-    dataset_default = [diabetes_data]
+    dataset_default = ["diabetes_data"]
+
+    # opt-in: the neighbors of every cv fold are searched once up to the
+    # largest n_neighbors and shared by all smaller values
+    reuse_neighbor_graph = False
+    single_metric_options = ("reuse_neighbor_graph",)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -48,14 +54,36 @@ class KNeighborsRegressorFunction(BaseRegression):
 
         return search_space
 
+    def create_model(self, params):
+        return KNeighborsRegressor(
+            n_neighbors=params["n_neighbors"],
+            algorithm=params["algorithm"],
+        )
+
+    def min_train_samples(self, params, y):
+        return max(params["n_neighbors"], super().min_train_samples(params, y))
+
     def create_objective_function(self):
         def k_neighbors_regressor(params):
-            knc = KNeighborsRegressor(
-                n_neighbors=params["n_neighbors"],
-                algorithm=params["algorithm"],
+            if self.reuse_neighbor_graph:
+                return self.neighbor_graph_score(params)
+
+            knc = self.create_model(params)
+            X, y = get_dataset(params["dataset"])
+            scores = cross_val_score(
+                knc, X, y, cv=params["cv"], scoring=self.primary_metric
             )
-            X, y = params["dataset"]()
-            scores = cross_val_score(knc, X, y, cv=params["cv"], scoring=self.metric)
             return scores.mean()
 
         self.pure_objective_function = k_neighbors_regressor
+
+    def neighbor_graph_score(self, params):
+        max_k = max(max(self.n_neighbors_default), params["n_neighbors"])
+        neighbor_graph = get_neighbor_graph(
+            params["dataset"],
+            params["cv"],
+            max_k,
+            algorithm=params["algorithm"],
+            classifier=False,
+        )
+        return neighbor_graph.score(params["n_neighbors"], self.primary_metric)
@@ -0,0 +1,50 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.metrics import get_scorer
+
+from .datasets import get_dataset
+from ._cross_validation import cv_folds
+from ._predicted_estimators import PredictedRegressor
+
+
+# (dataset, cv, max_depth, scoring) -> cv score of every n_estimators, starting
+# at 1, of this process
+_staged_scores = {}
+
+
+def fit_staged_scores(X, y, cv, max_depth, max_n_estimators, scoring):
+    # boosting is additive: the stages of one fit with max_n_estimators are
+    # the fits with fewer estimators
+    scorer = get_scorer(scoring)
+
+    fold_scores = []
+    for train, test in cv_folds(X, y, cv, classifier=False):
+        gradient_boosting_regressor = GradientBoostingRegressor(
+            n_estimators=max_n_estimators,
+            max_depth=max_depth,
+        ).fit(X[train], y[train])
+
+        fold_scores.append(
+            [
+                scorer(PredictedRegressor(prediction), X[test], y[test])
+                for prediction in gradient_boosting_regressor.staged_predict(X[test])
+            ]
+        )
+    return np.mean(fold_scores, axis=0)
+
+
+def get_staged_scores(dataset, cv, max_depth, max_n_estimators, scoring):
+    key = (getattr(dataset, "__name__", dataset), cv, max_depth, scoring)
+
+    staged_scores = _staged_scores.get(key)
+    if staged_scores is None or len(staged_scores) < max_n_estimators:
+        X, y = get_dataset(dataset)
+        staged_scores = fit_staged_scores(
+            np.asarray(X), np.asarray(y), cv, max_depth, max_n_estimators, scoring
+        )
+        _staged_scores[key] = staged_scores
+    return staged_scores
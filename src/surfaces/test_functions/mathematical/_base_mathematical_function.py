@@ -15,6 +15,10 @@ class MathematicalFunction(BaseTestFunction):
     formula = r" "
     global_minimum = r" "
 
+    _rebuilt_attributes = BaseTestFunction._rebuilt_attributes + (
+        "objective_function_fast",
+    )
+
     def __init__(
         self,
         metric="loss",
@@ -27,6 +31,62 @@ class MathematicalFunction(BaseTestFunction):
 
         self._objective_function_ = self.pure_objective_function
 
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.objective_function_fast = self.create_fast_objective_function()
+
+    # objective_function_fast resolves n_dim, metric and sleep once. It is
+    # rebuilt, when one of them is changed.
+    @property
+    def n_dim(self):
+        return self._n_dim
+
+    @n_dim.setter
+    def n_dim(self, n_dim):
+        self._n_dim = n_dim
+        self.dim_keys = tuple("x" + str(dim) for dim in range(n_dim))
+        self.create_dim_constants()
+        self.rebuild_fast_objective_function()
+
+    @property
+    def metric(self):
+        return self._metric
+
+    @metric.setter
+    def metric(self, metric):
+        self._metric = metric
+        self.rebuild_fast_objective_function()
+
+    @property
+    def sleep(self):
+        return self._sleep
+
+    @sleep.setter
+    def sleep(self, sleep):
+        self._sleep = sleep
+        self.rebuild_fast_objective_function()
+
+    def rebuild_fast_objective_function(self):
+        # the dimensions are set after metric and sleep in __init__
+        if "_n_dim" in self.__dict__:
+            self.objective_function_fast = self.create_fast_objective_function()
+
+    def create_dim_constants(self):
+        # the constants of the kernel, that depend on n_dim, are computed here
+        # and rebuilt when n_dim is changed
+        pass
+
+    def params2array(self, params):
+        # stacks the coordinates along the last axis: (..., n_dim)
+        X = np.array([params[dim_key] for dim_key in self.dim_keys])
+        if X.ndim > 1:
+            X = np.stack(X, axis=-1)
+        return X
+
+    def array_objective_function(self, X):
+        params = {dim_key: X[..., dim] for dim, dim_key in enumerate(self.dim_keys)}
+        return self.pure_objective_function(params)
+
     def return_metric(self, loss):
         if self.metric == "score":
             return -loss
@@ -35,6 +95,61 @@ class MathematicalFunction(BaseTestFunction):
         else:
             raise ValueError
 
+    def create_fast_objective_function(self):
+        # metric, sleep and the evaluation path of the dimensions are resolved
+        # once here instead of on every call
+        sign = self.return_metric(1)
+        sleep = self.sleep
+        dim_keys = self.dim_keys
+        pure_objective_function = self.pure_objective_function
+        array_objective_function = self.array_objective_function
+
+        if self._n_dim == 1:
+
+            def evaluate(x0):
+                return pure_objective_function({"x0": x0})
+
+        elif (
+            type(self).array_objective_function
+            is not MathematicalFunction.array_objective_function
+        ):
+            # the kernels of n-dimensional functions take the coordinates as
+            # one array
+            def evaluate(*args):
+                return array_objective_function(
+                    np.asarray(args[0] if len(args) == 1 else args)
+                )
+
+        else:
+
+            def evaluate(*args):
+                if len(args) == 1:
+                    return array_objective_function(np.asarray(args[0]))
+                return pure_objective_function(dict(zip(dim_keys, args)))
+
+        def objective_function_fast(*args):
+            if self.evaluation_stats is not None:
+                return sign * self._evaluate_recorded(evaluate, args, sleep)
+
+            if sleep:
+                self.clock.sleep(sleep)
+            return sign * evaluate(*args)
+
+        return objective_function_fast
+
+    def evaluate_batch(self, X):
+        # X has the shape (n_samples, n_dim), column i holds the values of "x{i}"
+        X = np.ascontiguousarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != self.n_dim:
+            msg = f"'X' must have the shape (n_samples, {self.n_dim})"
+            raise ValueError(msg)
+
+        # the simulated cost of all evaluations is paid in one call
+        loss = self._evaluate_with_sleep(
+            self.array_objective_function, (X,), self.sleep * len(X)
+        )
+        return self.return_metric(loss)
+
     @staticmethod
     def conv_arrays2lists(search_space):
         return {
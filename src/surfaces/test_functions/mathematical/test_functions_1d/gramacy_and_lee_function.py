@@ -33,7 +33,7 @@ class GramacyAndLeeFunction(MathematicalFunction):
         def gramacy_and_lee_function(params):
             x = params["x0"]
 
-            return (np.sin(10 * np.pi * x) / (2 * x)) + (x - 1) ** 4
+            return (np.sin(10 * np.pi * x) / (2 * x)) + np.power(x - 1, 4)
 
         self.pure_objective_function = gramacy_and_lee_function
 
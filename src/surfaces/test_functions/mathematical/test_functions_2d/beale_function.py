@@ -3,6 +3,8 @@
 # License: MIT License
 
 
+import numpy as np
+
 from .._base_mathematical_function import MathematicalFunction
 
 
@@ -39,9 +41,9 @@ http://www-optima.amp.i.kyoto-u.ac.jp/member/student/hedar/Hedar_files/TestGO
             x = params["x0"]
             y = params["x1"]
 
-            loss1 = (self.A - x + x * y) ** 2
-            loss2 = (self.B - x + x * y**2) ** 2
-            loss3 = (self.C - x + x * y**3) ** 2
+            loss1 = np.square(self.A - x + x * y)
+            loss2 = np.square(self.B - x + x * y * y)
+            loss3 = np.square(self.C - x + x * np.power(y, 3))
 
             return loss1 + loss2 + loss3
 
@@ -3,6 +3,8 @@
 # License: MIT License
 
 
+import numpy as np
+
 from .._base_mathematical_function import MathematicalFunction
 
 
@@ -34,8 +36,8 @@ http://www-optima.amp.i.kyoto-u.ac.jp/member/student/hedar/Hedar_files/TestGO
             x = params["x0"]
             y = params["x1"]
 
-            loss1 = (x + 2 * y - 7) ** 2
-            loss2 = (2 * x + y - 5) ** 2
+            loss1 = np.square(x + 2 * y - 7)
+            loss2 = np.square(2 * x + y - 5)
 
             return loss1 * loss2
 
@@ -34,7 +34,9 @@ class DropWaveFunction(MathematicalFunction):
             x = params["x0"]
             y = params["x1"]
 
-            return -(1 + np.cos(12 * np.sqrt(x**2 + y**2))) / (0.5 * (x**2 + y**2) + 2)
+            return -(1 + np.cos(12 * np.sqrt(x * x + y * y))) / (
+                0.5 * (x * x + y * y) + 2
+            )
 
         self.pure_objective_function = drop_wave_function
 
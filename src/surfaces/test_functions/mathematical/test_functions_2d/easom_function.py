@@ -39,7 +39,9 @@ class EasomFunction(MathematicalFunction):
             y = params["x1"]
 
             loss1 = self.A * np.cos(x * self.angle) * np.cos(y * self.angle)
-            loss2 = np.exp(-((x - np.pi / self.B) ** 2 + (y - np.pi / self.B) ** 2))
+            loss2 = np.exp(
+                -(np.square(x - np.pi / self.B) + np.square(y - np.pi / self.B))
+            )
 
             return loss1 * loss2
 
@@ -3,6 +3,8 @@
 # License: MIT License
 
 
+import numpy as np
+
 from .._base_mathematical_function import MathematicalFunction
 
 
@@ -32,11 +34,11 @@ class GoldsteinPriceFunction(MathematicalFunction):
             x = params["x0"]
             y = params["x1"]
 
-            loss1 = 1 + (x + y + 1) ** 2 * (
-                19 - 14 * x + 3 * x**2 - 14 * y + 6 * x * y + 3 * y**2
+            loss1 = 1 + np.square(x + y + 1) * (
+                19 - 14 * x + 3 * x * x - 14 * y + 6 * x * y + 3 * y * y
             )
-            loss2 = 30 + (2 * x - 3 * y) ** 2 * (
-                18 - 32 * x + 12 * x**2 + 48 * y - 36 * x * y + 27 * y**2
+            loss2 = 30 + np.square(2 * x - 3 * y) * (
+                18 - 32 * x + 12 * x * x + 48 * y - 36 * x * y + 27 * y * y
             )
 
             return loss1 * loss2
@@ -3,6 +3,8 @@
 # License: MIT License
 
 
+import numpy as np
+
 from .._base_mathematical_function import MathematicalFunction
 
 
@@ -40,8 +42,8 @@ class HimmelblausFunction(MathematicalFunction):
             x = params["x0"]
             y = params["x1"]
 
-            loss1 = (x**2 + y + self.A) ** 2
-            loss2 = (x + y**2 + self.B) ** 2
+            loss1 = np.square(x * x + y + self.A)
+            loss2 = np.square(x + y * y + self.B)
 
             return loss1 + loss2
 
@@ -43,7 +43,7 @@ class HölderTableFunction(MathematicalFunction):
             y = params["x1"]
 
             loss1 = np.sin(self.angle * x) * np.cos(self.angle * y)
-            loss2 = np.exp(abs(1 - (np.sqrt(x**2 + y**2) / np.pi)))
+            loss2 = np.exp(abs(1 - (np.sqrt(x * x + y * y) / np.pi)))
 
             return -np.abs(loss1 * loss2)
 
@@ -35,9 +35,9 @@ class LeviFunctionN13(MathematicalFunction):
             y = params["x1"]
 
             return (
-                np.sin(3 * np.pi * x) ** 2
-                + (x + 1) ** 2 * (1 + np.sin(3 * np.pi * y) ** 2)
-                + (y - 1) ** 2 * (1 + np.sin(3 * np.pi * y) ** 2)
+                np.square(np.sin(3 * np.pi * x))
+                + np.square(x + 1) * (1 + np.square(np.sin(3 * np.pi * y)))
+                + np.square(y - 1) * (1 + np.square(np.sin(3 * np.pi * y)))
             )
 
         self.pure_objective_function = levi_function_n13
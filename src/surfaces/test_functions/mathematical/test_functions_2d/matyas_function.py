@@ -32,7 +32,7 @@ class MatyasFunction(MathematicalFunction):
             x = params["x0"]
             y = params["x1"]
 
-            return 0.26 * (x**2 + y**2) - 0.48 * x * y
+            return 0.26 * (x * x + y * y) - 0.48 * x * y
 
         self.pure_objective_function = matyas_function
 
@@ -36,7 +36,7 @@ class McCormickFunction(MathematicalFunction):
             x = params["x0"]
             y = params["x1"]
 
-            return np.sin(x + y) + (x - y) ** 2 - 1.5 * x + 2.5 * y + 1
+            return np.sin(x + y) + np.square(x - y) - 1.5 * x + 2.5 * y + 1
 
         self.pure_objective_function = mccormick_function
 
@@ -34,7 +34,7 @@ class SchafferFunctionN2(MathematicalFunction):
             x = params["x0"]
             y = params["x1"]
 
-            return 100 * np.sqrt(np.abs(y - 0.01 * x**2)) + 0.01 * np.abs(x + 10)
+            return 100 * np.sqrt(np.abs(y - 0.01 * x * x)) + 0.01 * np.abs(x + 10)
 
         self.pure_objective_function = schaffer_function_n2
 
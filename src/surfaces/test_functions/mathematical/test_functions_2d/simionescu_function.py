@@ -50,9 +50,11 @@ class SimionescuFunction(MathematicalFunction):
             x = params["x0"].reshape(-1)
             y = params["x1"].reshape(-1)
 
-            condition = (self.r_T + self.r_S * np.cos(self.n * np.arctan(x / y))) ** 2
+            condition = np.square(
+                self.r_T + self.r_S * np.cos(self.n * np.arctan(x / y))
+            )
 
-            mask = x**2 + y**2 <= condition
+            mask = x * x + y * y <= condition
             mask_int = mask.astype(int)
 
             loss = self.A * x * y
@@ -34,7 +34,9 @@ class ThreeHumpCamelFunction(MathematicalFunction):
             x = params["x0"]
             y = params["x1"]
 
-            return 2 * x**2 - 1.05 * x**4 + x**6 / 6 + x * y + y**2
+            return (
+                2 * x * x - 1.05 * np.power(x, 4) + np.power(x, 6) / 6 + x * y + y * y
+            )
 
         self.pure_objective_function = three_hump_camel_function
 
@@ -29,20 +29,21 @@ class GriewankFunction(MathematicalFunction):
         super().__init__(metric, sleep)
         self.n_dim = n_dim
 
+    def create_dim_constants(self):
+        # 1 / sqrt(i) for i = 1, ..., n_dim
+        self.inv_sqrt_dims = 1 / np.sqrt(np.arange(1, self.n_dim + 1))
+
     def create_objective_function(self):
         def griewank_function(params):
-            loss_sum = 0
-            loss_product = 1
-            for dim in range(self.n_dim):
-                dim_str = "x" + str(dim)
-                x = params[dim_str]
+            return self.array_objective_function(self.params2array(params))
 
-                loss_sum += x**2 / 4000
-                loss_product *= np.cos(x / np.sqrt(dim + 1))
+        self.pure_objective_function = griewank_function
 
-            return loss_sum - loss_product + 1
+    def array_objective_function(self, X):
+        loss_sum = np.sum(X * X, axis=-1) / 4000
+        loss_product = np.prod(np.cos(X * self.inv_sqrt_dims), axis=-1)
 
-        self.pure_objective_function = griewank_function
+        return loss_sum - loss_product + 1
 
     def search_space(self, min=-100, max=100, size=10000, value_types="array"):
         return super().create_n_dim_search_space(
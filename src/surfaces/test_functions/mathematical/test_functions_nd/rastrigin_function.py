@@ -43,17 +43,14 @@ class RastriginFunction(MathematicalFunction):
 
     def create_objective_function(self):
         def rastrigin_function(params):
-            loss = 0
-            for dim in range(self.n_dim):
-                dim_str = "x" + str(dim)
-                x = params[dim_str]
-
-                loss += x * x - self.A * np.cos(self.angle * x)
-
-            return self.A * self.n_dim + loss
+            return self.array_objective_function(self.params2array(params))
 
         self.pure_objective_function = rastrigin_function
 
+    def array_objective_function(self, X):
+        loss = X * X - self.A * np.cos(self.angle * X)
+        return self.A * self.n_dim + np.sum(loss, axis=-1)
+
     def search_space(self, min=-5, max=5, size=10000, value_types="array"):
         return super().create_n_dim_search_space(
             min, max, size=size, value_types=value_types
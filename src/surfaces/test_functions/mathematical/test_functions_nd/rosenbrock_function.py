@@ -3,6 +3,8 @@
 # License: MIT License
 
 
+import numpy as np
+
 from .._base_mathematical_function import MathematicalFunction
 
 
@@ -39,18 +41,16 @@ class RosenbrockFunction(MathematicalFunction):
 
     def create_objective_function(self):
         def rosenbrock_function(params):
-            loss = 0
-            for dim in range(self.n_dim - 1):
-                dim_str = "x" + str(dim)
-                dim_str_1 = "x" + str(dim + 1)
+            return self.array_objective_function(self.params2array(params))
 
-                x = params[dim_str]
-                y = params[dim_str_1]
+        self.pure_objective_function = rosenbrock_function
 
-                loss += (self.A - x) ** 2 + self.B * (y - x**2) ** 2
-            return loss
+    def array_objective_function(self, X):
+        x = X[..., :-1]
+        y = X[..., 1:]
 
-        self.pure_objective_function = rosenbrock_function
+        loss = np.square(self.A - x) + self.B * np.square(y - x * x)
+        return np.sum(loss, axis=-1)
 
     def search_space(self, min=-5, max=5, size=10000, value_types="array"):
         return super().create_n_dim_search_space(
@@ -2,6 +2,8 @@
 # Email: simon.blanke@yahoo.com
 # License: MIT License
 
+import numpy as np
+
 from .._base_mathematical_function import MathematicalFunction
 
 
@@ -27,17 +29,13 @@ class SphereFunction(MathematicalFunction):
 
     def create_objective_function(self):
         def sphere_function(params):
-            loss = 0
-            for dim in range(self.n_dim):
-                dim_str = "x" + str(dim)
-                x = params[dim_str]
-
-                loss += self.A * x * x
-
-            return loss
+            return self.array_objective_function(self.params2array(params))
 
         self.pure_objective_function = sphere_function
 
+    def array_objective_function(self, X):
+        return np.sum(self.A * X * X, axis=-1)
+
     def search_space(self, min=-5, max=5, size=10000, value_types="array"):
         return super().create_n_dim_search_space(
             min, max, size=size, value_types=value_types
@@ -3,6 +3,8 @@
 # License: MIT License
 
 
+import numpy as np
+
 from .._base_mathematical_function import MathematicalFunction
 
 
@@ -31,17 +33,14 @@ class StyblinskiTangFunction(MathematicalFunction):
 
     def create_objective_function(self):
         def styblinski_tang_function(params):
-            loss = 0
-            for dim in range(self.n_dim):
-                dim_str = "x" + str(dim)
-                x = params[dim_str]
-
-                loss += x**4 - 16 * x**2 + 5 * x
-
-            return loss / 2
+            return self.array_objective_function(self.params2array(params))
 
         self.pure_objective_function = styblinski_tang_function
 
+    def array_objective_function(self, X):
+        loss = np.power(X, 4) - 16 * X * X + 5 * X
+        return np.sum(loss, axis=-1) / 2
+
     def search_space(self, min=-5, max=5, size=10000, value_types="array"):
         return super().create_n_dim_search_space(
             min, max, size=size, value_types=value_types
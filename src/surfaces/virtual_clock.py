@@ -0,0 +1,21 @@
+# Author: Simon Blanke
+# Email: simon.blanke@yahoo.com
+# License: MIT License
+
+
+class VirtualClock:
+    # drop-in replacement for the `time`-module as the clock of a test function:
+    # sleep advances the simulated time instead of blocking
+
+    def __init__(self, start=0):
+        self.start = start
+        self.elapsed = 0
+
+    def sleep(self, seconds):
+        self.elapsed += seconds
+
+    def time(self):
+        return self.start + self.elapsed
+
+    def reset(self):
+        self.elapsed = 0
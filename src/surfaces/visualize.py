@@ -4,14 +4,21 @@
 
 
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 
-from tqdm import tqdm
+# plotly, matplotlib and tqdm are imported inside of the plot functions,
+# because importing them takes longer than importing the rest of the package
 
-color_scale = px.colors.sequential.Jet
+
+def __getattr__(name):
+    if name == "color_scale":
+        return _color_scale()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _color_scale():
+    import plotly.express as px
+
+    return px.colors.sequential.Jet
 
 
 def _create_grid(objective_function, search_space):
@@ -37,6 +44,9 @@ def plotly_surface_new(
     height=900,
     contour=False,
 ):
+    import plotly.graph_objects as go
+    from tqdm import tqdm
+
     if len(search_space) < 2:
         error = "search space must be at least two dimensional"
         raise Exception(error)
@@ -86,7 +96,7 @@ def plotly_surface_new(
             z=zi,
             x=xi,
             y=yi,
-            colorscale=color_scale,
+            colorscale=_color_scale(),
         ),
     )
 
@@ -120,6 +130,8 @@ def plotly_surface(
     height=900,
     contour=False,
 ):
+    import plotly.graph_objects as go
+
     if len(search_space) != 2:
         error = "search space must be two dimensional"
         raise Exception(error)
@@ -131,7 +143,7 @@ def plotly_surface(
             z=zi,
             x=xi,
             y=yi,
-            colorscale=color_scale,
+            colorscale=_color_scale(),
         ),
     )
 
@@ -165,6 +177,8 @@ def plotly_heatmap(
     width=900,
     height=900,
 ):
+    import plotly.express as px
+
     xi, yi, zi = _create_grid(objective_function, search_space)
 
     fig = px.imshow(
@@ -172,7 +186,7 @@ def plotly_heatmap(
         x=search_space["x0"],
         y=search_space["x1"],
         labels=dict(x="X", y="Y", color="Metric"),
-        color_continuous_scale=color_scale,
+        color_continuous_scale=_color_scale(),
     )
     fig.update_layout(
         title=title,
@@ -189,6 +203,9 @@ def matplotlib_heatmap(
     title="Objective Function Heatmap",
     norm=None,
 ):
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
     if norm == "color_log":
         norm = mpl.colors.LogNorm()
 
@@ -218,6 +235,9 @@ def matplotlib_surface(
     title="Objective Function Surface",
     norm=None,
 ):
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
     if norm == "color_log":
         norm = mpl.colors.LogNorm()
 
@@ -0,0 +1,59 @@
+import pytest
+import numpy as np
+
+from surfaces.test_functions.machine_learning import KNeighborsClassifierFunction
+from surfaces.test_functions.machine_learning.tabular import datasets
+from surfaces.test_functions.machine_learning.tabular.classification.datasets import (
+    iris_data,
+)
+
+
+def test_names_and_functions():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    para = {"n_neighbors": 5, "algorithm": "auto", "cv": 3}
+
+    assert k_neighbors_classifier.objective_function(
+        {**para, "dataset": "iris_data"}
+    ) == k_neighbors_classifier.objective_function({**para, "dataset": iris_data})
+
+
+def test_cached():
+    assert datasets.load_dataset("wine_data") is datasets.load_dataset("wine_data")
+
+    with pytest.raises(ValueError, match="Unknown dataset"):
+        datasets.load_dataset("wine")
+
+
+def test_cache_dir(tmp_path):
+    X, y = datasets.load_dataset("iris_data")
+
+    datasets.set_cache_dir(tmp_path)
+    try:
+        X_mmap, y_mmap = datasets.load_dataset("iris_data")
+        assert (tmp_path / "iris_data_X.npy").is_file()
+        assert isinstance(X_mmap, np.memmap)
+        np.testing.assert_array_equal(X_mmap, X)
+        np.testing.assert_array_equal(y_mmap, y)
+    finally:
+        datasets.set_cache_dir(None)
+
+
+@pytest.fixture
+def random_data():
+    def random_data():
+        rng = np.random.default_rng(0)
+        return rng.normal(size=(60, 3)), rng.integers(0, 2, size=60)
+
+    datasets.register_dataset("random_data", random_data)
+    yield "random_data"
+    # the loader and the loaded arrays are removed
+    del datasets.dataset_loaders["random_data"]
+    datasets._datasets.pop("random_data", None)
+
+
+def test_register_dataset(random_data):
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    k_neighbors_classifier.objective_function(
+        {"n_neighbors": 5, "algorithm": "auto", "cv": 3, "dataset": random_data}
+    )
+    assert "random_data" in datasets._datasets
@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+
+from surfaces.test_functions import mathematical_functions
+
+
+mathematical_functions_d = (
+    "test_function",
+    mathematical_functions,
+)
+
+
+metric_d = (
+    "metric",
+    ["score", "loss"],
+)
+
+
+def _random_population(test_function_, n_samples=200):
+    search_space = test_function_.search_space(value_types="array")
+    rng = np.random.default_rng(0)
+
+    return np.stack(
+        [rng.choice(dim_values, n_samples) for dim_values in search_space.values()],
+        axis=1,
+    )
+
+
+@pytest.mark.parametrize(*mathematical_functions_d)
+@pytest.mark.parametrize(*metric_d)
+def test_evaluate_batch(test_function, metric):
+    try:
+        test_function_ = test_function(metric=metric)
+    except TypeError:
+        test_function_ = test_function(n_dim=3, metric=metric)
+
+    X = _random_population(test_function_)
+    results = test_function_.evaluate_batch(X)
+
+    results_single = []
+    for x in X:
+        para = {f"x{dim}": value for dim, value in enumerate(x)}
+        result = test_function_.objective_function(para)
+        results_single.append(np.asarray(result).reshape(()))
+
+    assert results.shape == (len(X),)
+    np.testing.assert_array_equal(results, np.array(results_single))
+
+
+@pytest.mark.parametrize(*mathematical_functions_d)
+def test_evaluate_batch_shape(test_function):
+    try:
+        test_function_ = test_function()
+    except TypeError:
+        test_function_ = test_function(n_dim=3)
+
+    with pytest.raises(ValueError):
+        test_function_.evaluate_batch(np.zeros((10, test_function_.n_dim + 1)))
@@ -0,0 +1,85 @@
+import pytest
+
+from surfaces.virtual_clock import VirtualClock
+from surfaces.test_functions.machine_learning import KNeighborsRegressorFunction
+from surfaces.data_collector import SurfacesDataCollector
+
+
+@pytest.fixture(scope="module")
+def sdc(tmp_path_factory):
+    test_function_ = KNeighborsRegressorFunction()
+    search_space = test_function_.search_space(
+        n_neighbors=[3, 4, 5],
+        algorithm=["auto", "brute"],
+        cv=[2],
+        dataset=[test_function_.dataset_default[0]],
+    )
+
+    search_data_path = tmp_path_factory.mktemp("from_data") / "search_data.db"
+    sdc = SurfacesDataCollector(path=str(search_data_path))
+    sdc.collect(test_function_.objective_function, search_space, if_exists="replace")
+    yield sdc
+    sdc.remove()
+
+
+def test_evaluate_from_data(sdc):
+    test_function_ = KNeighborsRegressorFunction()
+    test_function_loaded = KNeighborsRegressorFunction(evaluate_from_data=True)
+    test_function_loaded.sdc = sdc
+
+    for n_neighbors in [3, 4, 5]:
+        para = {
+            "n_neighbors": n_neighbors,
+            "algorithm": "brute",
+            "cv": 2,
+            "dataset": test_function_.dataset_default[0],
+        }
+        para_copy = dict(para)
+
+        assert test_function_loaded.objective_function(para) == pytest.approx(
+            test_function_.objective_function(para)
+        )
+        # the parameters of the caller are not modified
+        assert para == para_copy
+
+    # the search data is only loaded on the first evaluation
+    test_function_loaded.sdc = None
+    test_function_loaded.objective_function(para)
+
+
+def test_missing_parameters(sdc):
+    test_function_loaded = KNeighborsRegressorFunction(evaluate_from_data=True)
+    test_function_loaded.sdc = sdc
+
+    para = {
+        "n_neighbors": 100,
+        "algorithm": "brute",
+        "cv": 2,
+        "dataset": test_function_loaded.dataset_default[0],
+    }
+    with pytest.raises(KeyError, match="not in the search data"):
+        test_function_loaded.objective_function(para)
+
+
+def test_replay_eval_time(sdc):
+    test_function_loaded = KNeighborsRegressorFunction(evaluate_from_data=True)
+    test_function_loaded.sdc = sdc
+    test_function_loaded.clock = VirtualClock()
+    test_function_loaded.replay_eval_time = True
+
+    search_data = sdc.load(
+        test_function_loaded._name_, filters={"algorithm": "brute", "n_neighbors": 4}
+    )
+    (eval_time,) = search_data["eval_time"]
+    assert eval_time > 0
+
+    para = {
+        "n_neighbors": 4,
+        "algorithm": "brute",
+        "cv": 2,
+        "dataset": test_function_loaded.dataset_default[0],
+    }
+    test_function_loaded.objective_function(para)
+    test_function_loaded.objective_function(para)
+
+    assert test_function_loaded.clock.time() == pytest.approx(2 * eval_time)
@@ -0,0 +1,132 @@
+import os
+import pickle
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+
+from surfaces.evaluation_cache import EvaluationCache
+from surfaces.virtual_clock import VirtualClock
+from surfaces.test_functions import machine_learning_functions
+from surfaces.test_functions.machine_learning import KNeighborsClassifierFunction
+from surfaces.test_functions.machine_learning import _base_machine_learning
+
+
+machine_learning_functions_d = (
+    "test_function",
+    machine_learning_functions,
+)
+
+
+def _list_of_params(test_function_, n_params=6):
+    search_space = test_function_.search_space()
+    first_para = test_function_.para_names[0]
+
+    return [
+        {
+            first_para: dim_value,
+            **{
+                para_name: search_space[para_name][0]
+                for para_name in test_function_.para_names[1:]
+            },
+            "cv": 2,
+        }
+        for dim_value in search_space[first_para][:n_params]
+    ]
+
+
+@pytest.mark.parametrize(*machine_learning_functions_d)
+def test_evaluate_many(test_function):
+    test_function_ = test_function()
+    list_of_params = _list_of_params(test_function_)
+
+    scores = test_function_.evaluate_many(list_of_params, n_jobs=2)
+    scores_single = [
+        test_function_.objective_function(params) for params in list_of_params
+    ]
+    # gradient boosting is not deterministic without a random state
+    assert scores == pytest.approx(scores_single, rel=0.05)
+
+
+def test_persistent_pool():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    list_of_params = _list_of_params(k_neighbors_classifier, n_params=2)
+
+    k_neighbors_classifier.evaluate_many(list_of_params, n_jobs=2)
+    process_pool = k_neighbors_classifier.get_process_pool(2)
+    k_neighbors_classifier.evaluate_many(list_of_params, n_jobs=2)
+
+    assert k_neighbors_classifier.get_process_pool(2) is process_pool
+
+
+def test_virtual_clock():
+    k_neighbors_classifier = KNeighborsClassifierFunction(sleep=100)
+    k_neighbors_classifier.clock = VirtualClock()
+    list_of_params = _list_of_params(k_neighbors_classifier, n_params=4)
+
+    k_neighbors_classifier.evaluate_many(list_of_params, n_jobs=2)
+    assert k_neighbors_classifier.clock.time() == 400
+
+
+def test_cache():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    k_neighbors_classifier.cache = EvaluationCache()
+    list_of_params = _list_of_params(k_neighbors_classifier, n_params=4)
+
+    scores = k_neighbors_classifier.evaluate_many(list_of_params[:2], n_jobs=2)
+    assert len(k_neighbors_classifier.cache) == 2
+
+    # the cached parameters are not evaluated again
+    scores += k_neighbors_classifier.evaluate_many(list_of_params[2:], n_jobs=2)
+    assert k_neighbors_classifier.evaluate_many(list_of_params, n_jobs=2) == scores
+    assert k_neighbors_classifier.cache.hits == 4
+
+
+def test_shutdown_process_pools():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    list_of_params = _list_of_params(k_neighbors_classifier, n_params=2)
+
+    k_neighbors_classifier.evaluate_many(list_of_params, n_jobs=2)
+    process_pool = k_neighbors_classifier.get_process_pool(2)
+    KNeighborsClassifierFunction.shutdown_process_pools()
+
+    assert k_neighbors_classifier.get_process_pool(2) is not process_pool
+    k_neighbors_classifier.evaluate_many(list_of_params, n_jobs=2)
+
+
+def test_transient_state():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    list_of_params = _list_of_params(k_neighbors_classifier, n_params=2)
+    k_neighbors_classifier.objective_function_fidelity(list_of_params[0], 0.5)
+
+    test_function_loaded = pickle.loads(pickle.dumps(k_neighbors_classifier))
+    assert k_neighbors_classifier.fold_scores
+    assert test_function_loaded.fold_scores == {}
+
+
+def test_worker_copy():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    k_neighbors_classifier.cache = EvaluationCache()
+    for n_neighbors in range(1000):
+        k_neighbors_classifier.cache.put(
+            k_neighbors_classifier.cache.create_key({"n_neighbors": n_neighbors}), 0.5
+        )
+
+    # the cache is not sent to the workers
+    worker_copy = k_neighbors_classifier.worker_copy()
+    assert worker_copy.cache is None
+    assert len(pickle.dumps(worker_copy)) < len(pickle.dumps(k_neighbors_classifier))
+    assert len(k_neighbors_classifier.cache) == 1000
+
+
+class CrashingFunction(KNeighborsClassifierFunction):
+    def evaluate(self, params):
+        os._exit(1)
+
+
+def test_broken_process_pool():
+    crashing_function = CrashingFunction()
+    list_of_params = _list_of_params(crashing_function, n_params=2)
+
+    with pytest.raises(BrokenProcessPool):
+        crashing_function.evaluate_many(list_of_params, n_jobs=2)
+    # the broken pool is not reused by the next call
+    assert (CrashingFunction, 2) not in _base_machine_learning._process_pools
@@ -0,0 +1,85 @@
+import numpy as np
+
+from surfaces.evaluation_cache import EvaluationCache
+from surfaces.virtual_clock import VirtualClock
+from surfaces.test_functions.mathematical import SphereFunction
+from surfaces.test_functions.machine_learning import KNeighborsRegressorFunction
+
+
+def test_hits_and_misses():
+    k_neighbors_regressor = KNeighborsRegressorFunction(sleep=10)
+    k_neighbors_regressor.clock = VirtualClock()
+    k_neighbors_regressor.cache = EvaluationCache(max_entries=10)
+
+    para = {
+        "n_neighbors": 5,
+        "algorithm": "auto",
+        "cv": 2,
+        "dataset": k_neighbors_regressor.dataset_default[0],
+    }
+    score = k_neighbors_regressor.objective_function(para)
+    score_cached = k_neighbors_regressor.objective_function(dict(para))
+
+    assert score == score_cached
+    assert k_neighbors_regressor.cache.hits == 1
+    assert k_neighbors_regressor.cache.misses == 1
+    # the simulated cost is only paid once
+    assert k_neighbors_regressor.clock.time() == 10
+
+
+def test_numpy_and_python_values():
+    sphere_function = SphereFunction(n_dim=2)
+    sphere_function.cache = EvaluationCache()
+
+    sphere_function.objective_function({"x0": np.float64(1.5), "x1": np.int64(2)})
+    sphere_function.objective_function({"x1": 2, "x0": 1.5})
+
+    assert sphere_function.cache.hits == 1
+
+
+def test_max_entries():
+    sphere_function = SphereFunction(n_dim=2)
+    sphere_function.cache = EvaluationCache(max_entries=3)
+
+    for x0 in [0, 1, 2, 0, 3]:
+        sphere_function.objective_function({"x0": x0, "x1": 0})
+
+    # 1 was the least recently used entry
+    assert len(sphere_function.cache) == 3
+    assert (
+        sphere_function.cache.create_key({"x0": 1, "x1": 0})
+        not in sphere_function.cache
+    )
+    assert sphere_function.cache.create_key({"x0": 0, "x1": 0}) in sphere_function.cache
+
+
+def test_max_bytes():
+    cache = EvaluationCache(max_bytes=2000)
+    for x0 in range(100):
+        cache.put(cache.create_key({"x0": x0}), float(x0))
+
+    assert 0 < len(cache) < 100
+    assert cache.n_bytes <= 2000
+
+
+def test_function_values():
+    def dataset():
+        pass
+
+    def other_dataset():
+        pass
+
+    key = EvaluationCache.create_key
+    assert key({"dataset": np.sum}) == key({"dataset": np.sum})
+    assert key({"dataset": dataset}) != key({"dataset": other_dataset})
+    assert key({"dataset": lambda: 1}) != key({"dataset": lambda: 1})
+
+
+def test_unhashable_values():
+    sphere_function = SphereFunction(n_dim=2)
+    sphere_function.cache = EvaluationCache()
+
+    xi, yi = np.meshgrid(np.arange(3), np.arange(3))
+    sphere_function.objective_function({"x0": xi, "x1": yi})
+
+    assert len(sphere_function.cache) == 0
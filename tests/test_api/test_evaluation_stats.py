@@ -0,0 +1,103 @@
+import asyncio
+import numpy as np
+
+from surfaces.evaluation_cache import EvaluationCache
+from surfaces.evaluation_stats import EvaluationStats
+from surfaces.virtual_clock import VirtualClock
+from surfaces.test_functions.mathematical import SphereFunction
+from surfaces.test_functions.machine_learning import KNeighborsRegressorFunction
+
+
+para_knr = {"n_neighbors": 5, "algorithm": "auto", "cv": 2, "dataset": "diabetes_data"}
+
+
+def test_disabled():
+    sphere_function = SphereFunction(n_dim=2)
+    sphere_function.objective_function({"x0": 1, "x1": 1})
+
+    assert sphere_function.stats() is None
+    sphere_function.reset_stats()
+
+
+def test_stats():
+    sphere_function = SphereFunction(n_dim=2, sleep=2)
+    sphere_function.clock = VirtualClock()
+    sphere_function.evaluation_stats = EvaluationStats()
+
+    for x0 in range(10):
+        sphere_function.objective_function({"x0": x0, "x1": 1})
+
+    stats = sphere_function.stats()
+    assert stats["n_calls"] == 10
+    assert stats["sleep_time"] == 20
+    assert 0 < stats["compute_time"] <= stats["total_latency"]
+    assert sum(stats["latency_counts"]) == 10
+    assert len(stats["latency_counts"]) == len(stats["latency_bucket_edges"]) + 1
+
+    sphere_function.reset_stats()
+    stats = sphere_function.stats()
+    assert stats["n_calls"] == 0
+    assert sum(stats["latency_counts"]) == 0
+
+
+def test_compute_time():
+    k_neighbors_regressor = KNeighborsRegressorFunction()
+    sphere_function = SphereFunction(n_dim=2)
+    k_neighbors_regressor.evaluation_stats = EvaluationStats()
+    sphere_function.evaluation_stats = EvaluationStats()
+
+    k_neighbors_regressor.objective_function(
+        {
+            "n_neighbors": 5,
+            "algorithm": "auto",
+            "cv": 5,
+            "dataset": k_neighbors_regressor.dataset_default[0],
+        }
+    )
+    sphere_function.objective_function({"x0": 1, "x1": 1})
+
+    assert (
+        k_neighbors_regressor.stats()["compute_time"]
+        > sphere_function.stats()["compute_time"]
+    )
+
+
+def test_batch_paths():
+    sphere_function = SphereFunction(n_dim=2, sleep=1)
+    sphere_function.clock = VirtualClock()
+    sphere_function.evaluation_stats = EvaluationStats()
+
+    sphere_function.evaluate_batch(np.zeros((1000, 2)))
+    sphere_function.objective_function_fast(1, 1)
+    sphere_function.objective_function_fast(np.zeros((10, 2)))
+
+    stats = sphere_function.stats()
+    assert stats["n_calls"] == 1011
+    assert stats["sleep_time"] == 1002
+    assert sum(stats["latency_counts"]) == 1011
+
+
+def test_machine_learning_paths():
+    k_neighbors_regressor = KNeighborsRegressorFunction()
+    k_neighbors_regressor.evaluation_stats = EvaluationStats()
+    list_of_params = [{**para_knr, "n_neighbors": k} for k in [3, 4, 5, 6]]
+
+    k_neighbors_regressor.evaluate_batch(list_of_params[:2])
+    k_neighbors_regressor.evaluate_many(list_of_params, n_jobs=2)
+    asyncio.run(k_neighbors_regressor.objective_function_async(para_knr))
+    k_neighbors_regressor.objective_function_fidelity(para_knr, fidelity=0.5)
+
+    assert k_neighbors_regressor.stats()["n_calls"] == 8
+
+
+def test_cache_hits():
+    sphere_function = SphereFunction(n_dim=2)
+    sphere_function.cache = EvaluationCache()
+    sphere_function.evaluation_stats = EvaluationStats()
+
+    for _ in range(3):
+        sphere_function.objective_function({"x0": 1, "x1": 1})
+
+    stats = sphere_function.stats()
+    assert stats["n_calls"] == 3
+    assert stats["n_cache_hits"] == 2
@@ -0,0 +1,97 @@
+import pytest
+
+from surfaces.virtual_clock import VirtualClock
+from surfaces.test_functions.machine_learning import (
+    KNeighborsClassifierFunction,
+    GradientBoostingRegressorFunction,
+)
+
+
+para = {"n_neighbors": 5, "algorithm": "auto", "cv": 4, "dataset": "iris_data"}
+
+
+def test_full_fidelity():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+
+    assert k_neighbors_classifier.objective_function_fidelity(para) == pytest.approx(
+        k_neighbors_classifier.objective_function(para)
+    )
+
+
+@pytest.mark.parametrize("fidelity_mode", ["folds", "samples"])
+def test_low_fidelity(fidelity_mode):
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    k_neighbors_classifier.fidelity_mode = fidelity_mode
+
+    score = k_neighbors_classifier.objective_function_fidelity(para, fidelity=0.5)
+    assert 0 <= score <= 1
+
+
+def test_lowest_sample_fidelity():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    k_neighbors_classifier.fidelity_mode = "samples"
+
+    # the models are fit on at least n_neighbors samples
+    score = k_neighbors_classifier.objective_function_fidelity(para, fidelity=0.02)
+    assert 0 <= score <= 1
+
+
+def test_reuse_folds():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+
+    k_neighbors_classifier.objective_function_fidelity(para, fidelity=0.25)
+    assert len(k_neighbors_classifier.fold_scores) == 1
+
+    # only the three missing folds are evaluated after the promotion
+    k_neighbors_classifier.objective_function_fidelity(para, fidelity=1)
+    assert len(k_neighbors_classifier.fold_scores) == 4
+
+
+def test_metric_changed():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    k_neighbors_classifier.objective_function_fidelity(para, fidelity=0.5)
+
+    # the fold scores of the previous metric are not reused
+    k_neighbors_classifier.metric = "f1_macro"
+    k_neighbors_classifier.objective_function_fidelity(para, fidelity=0.5)
+    assert len(k_neighbors_classifier.fold_scores) == 4
+
+
+def test_bounded_fold_scores():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    k_neighbors_classifier.max_fold_scores = 3
+
+    k_neighbors_classifier.objective_function_fidelity(para)
+    assert len(k_neighbors_classifier.fold_scores) == 3
+    # the score of the first fold is dropped
+    assert [key[2] for key in k_neighbors_classifier.fold_scores] == [1, 2, 3]
+
+
+def test_stages():
+    gradient_boosting_regressor = GradientBoostingRegressorFunction()
+    gradient_boosting_regressor.fidelity_mode = "stages"
+
+    para_gbr = {"n_estimators": 20, "max_depth": 2, "cv": 2, "dataset": "diabetes_data"}
+    gradient_boosting_regressor.objective_function_fidelity(para_gbr, fidelity=0.5)
+
+    (key, _, _, _), *_ = gradient_boosting_regressor.fold_scores
+    assert ("n_estimators", 10) in key
+
+
+def test_sleep_scales():
+    k_neighbors_classifier = KNeighborsClassifierFunction(sleep=10)
+    k_neighbors_classifier.clock = VirtualClock()
+
+    k_neighbors_classifier.objective_function_fidelity(para, fidelity=0.25)
+    assert k_neighbors_classifier.clock.time() == 2.5
+
+
+def test_invalid():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+
+    with pytest.raises(ValueError, match="fidelity"):
+        k_neighbors_classifier.objective_function_fidelity(para, fidelity=0)
+
+    k_neighbors_classifier.fidelity_mode = "stages"
+    with pytest.raises(ValueError, match="fidelity_mode"):
+        k_neighbors_classifier.objective_function_fidelity(para, fidelity=0.5)
@@ -0,0 +1,77 @@
+import sys
+import subprocess
+
+import pytest
+
+
+# seconds that importing the mathematical functions may take, without the
+# startup of the interpreter
+import_time_budget = 1.5
+
+heavy_dependencies = (
+    "sklearn",
+    "pandas",
+    "hyperactive",
+    "gradient_free_optimizers",
+    "search_data_collector",
+    "plotly",
+    "matplotlib",
+)
+
+
+def _import_in_subprocess(statement):
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(','.join(m for m in {heavy_dependencies!r} if m in sys.modules))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    imported = output[1].split(",") if len(output) > 1 and output[1] else []
+    return float(output[0]), imported
+
+
+@pytest.mark.parametrize(
+    "statement",
+    (
+        "from surfaces.test_functions.mathematical import SphereFunction",
+        "from surfaces.test_functions import mathematical_functions",
+        "import surfaces.data_collector",
+        "import surfaces.visualize",
+    ),
+)
+def test_no_heavy_dependencies(statement):
+    _, imported = _import_in_subprocess(statement)
+    assert imported == []
+
+
+def test_import_time_budget():
+    # the fastest of a few runs is the least disturbed by other processes
+    t_import = min(
+        _import_in_subprocess(
+            "from surfaces.test_functions.mathematical import SphereFunction"
+        )[0]
+        for _ in range(3)
+    )
+    assert t_import < import_time_budget
+
+
+def test_lazy_attributes():
+    from surfaces.test_functions import (
+        mathematical_functions,
+        machine_learning_functions,
+        test_functions,
+    )
+    from surfaces.data_collector import SurfacesDataCollector, ScoreTensor
+
+    assert test_functions == mathematical_functions + machine_learning_functions
+    assert SurfacesDataCollector.__name__ == "SurfacesDataCollector"
+    assert ScoreTensor.__name__ == "ScoreTensor"
+
+    import surfaces.test_functions
+
+    with pytest.raises(AttributeError):
+        surfaces.test_functions.no_test_functions
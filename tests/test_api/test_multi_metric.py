@@ -0,0 +1,63 @@
+import pytest
+
+from surfaces.test_functions.machine_learning import KNeighborsClassifierFunction
+
+
+para = {"n_neighbors": 5, "algorithm": "auto", "cv": 3, "dataset": "iris_data"}
+metrics = ["accuracy", "f1_macro", "neg_log_loss"]
+
+
+def test_record():
+    k_neighbors_classifier = KNeighborsClassifierFunction(metric=metrics)
+    record = k_neighbors_classifier.evaluate_metrics(para)
+
+    assert set(record) == set(metrics) | {"fit_time", "score_time"}
+    for metric in metrics:
+        assert record[metric] == pytest.approx(
+            KNeighborsClassifierFunction(metric=metric).objective_function(para)
+        )
+
+
+def test_objective_function():
+    k_neighbors_classifier = KNeighborsClassifierFunction(metric=metrics)
+    score = k_neighbors_classifier.objective_function(para)
+
+    (record,) = k_neighbors_classifier.metric_records.values()
+    assert score == record["accuracy"]
+
+
+def test_single_metric():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    record = k_neighbors_classifier.evaluate_metrics(para, metrics=["f1_macro"])
+
+    assert "f1_macro" in record
+    assert "accuracy" not in record
+
+
+def test_records_bounded():
+    k_neighbors_classifier = KNeighborsClassifierFunction(metric=metrics)
+    k_neighbors_classifier.max_metric_records = 2
+
+    for n_neighbors in [3, 4, 5]:
+        k_neighbors_classifier.objective_function({**para, "n_neighbors": n_neighbors})
+
+    assert len(k_neighbors_classifier.metric_records) == 2
+
+
+def test_single_metric_options():
+    k_neighbors_classifier = KNeighborsClassifierFunction(metric=metrics)
+    k_neighbors_classifier.reuse_neighbor_graph = True
+
+    with pytest.raises(ValueError, match="reuse_neighbor_graph"):
+        k_neighbors_classifier.objective_function(para)
+
+
+def test_pruner_and_fidelity():
+    k_neighbors_classifier = KNeighborsClassifierFunction(metric=metrics)
+
+    with pytest.raises(ValueError, match="objective_function_fidelity"):
+        k_neighbors_classifier.objective_function_fidelity(para, fidelity=0.5)
+
+    k_neighbors_classifier.pruner = lambda params, fold, scores: False
+    with pytest.raises(ValueError, match="pruner"):
+        k_neighbors_classifier.objective_function(para)
@@ -0,0 +1,65 @@
+import pytest
+import numpy as np
+
+from surfaces.test_functions.mathematical import (
+    GriewankFunction,
+    RastriginFunction,
+    RosenbrockFunction,
+    SphereFunction,
+    StyblinskiTangFunction,
+)
+
+
+global_minimum_d = (
+    "test_function, x_min, f_min",
+    [
+        (GriewankFunction, 0, 0),
+        (RastriginFunction, 0, 0),
+        (RosenbrockFunction, 1, 0),
+        (SphereFunction, 0, 0),
+        (StyblinskiTangFunction, -2.903534, -39.166165),
+    ],
+)
+
+
+n_dim_d = (
+    "n_dim",
+    [1, 2, 10, 1000],
+)
+
+
+@pytest.mark.parametrize(*global_minimum_d)
+@pytest.mark.parametrize(*n_dim_d)
+def test_global_minimum(test_function, x_min, f_min, n_dim):
+    test_function_ = test_function(n_dim=n_dim, metric="loss")
+
+    para = {f"x{dim}": x_min for dim in range(n_dim)}
+    loss = test_function_.objective_function(para)
+    assert loss == pytest.approx(f_min * n_dim, abs=1e-6 * n_dim)
+
+    X = np.full((5, n_dim), x_min, dtype=float)
+    losses = test_function_.evaluate_batch(X)
+    np.testing.assert_allclose(losses, f_min * n_dim, atol=1e-6 * n_dim)
+
+
+@pytest.mark.parametrize(*global_minimum_d)
+def test_meshgrid_input(test_function, x_min, f_min):
+    test_function_ = test_function(n_dim=2)
+
+    xi, yi = np.meshgrid(np.arange(-2, 2, 0.5), np.arange(-3, 3, 0.5))
+    zi = test_function_.objective_function({"x0": xi, "x1": yi})
+
+    assert zi.shape == xi.shape
+    assert zi[0, 0] == test_function_.objective_function({"x0": -2, "x1": -3})
+
+
+@pytest.mark.parametrize(*global_minimum_d)
+def test_change_n_dim(test_function, x_min, f_min):
+    test_function_ = test_function(n_dim=2, metric="loss")
+    test_function_.n_dim = 4
+
+    para = {f"x{dim}": x_min for dim in range(4)}
+    assert test_function_.objective_function(para) == pytest.approx(f_min * 4, abs=4e-6)
+    assert test_function_.objective_function_fast(*[x_min] * 4) == pytest.approx(
+        f_min * 4, abs=4e-6
+    )
@@ -0,0 +1,73 @@
+import pytest
+
+from surfaces.test_functions.machine_learning import (
+    KNeighborsClassifierFunction,
+    KNeighborsRegressorFunction,
+)
+from surfaces.test_functions.machine_learning.tabular import neighbor_graph
+
+
+k_neighbors_functions = (
+    ("test_function", "dataset"),
+    (
+        (KNeighborsClassifierFunction, "wine_data"),
+        (KNeighborsRegressorFunction, "diabetes_data"),
+    ),
+)
+
+
+@pytest.mark.parametrize(*k_neighbors_functions)
+def test_same_scores(test_function, dataset):
+    test_function_ = test_function()
+    test_function_graph = test_function()
+    test_function_graph.reuse_neighbor_graph = True
+
+    for n_neighbors in [3, 8, 48]:
+        para = {
+            "n_neighbors": n_neighbors,
+            "algorithm": "brute",
+            "cv": 3,
+            "dataset": dataset,
+        }
+        assert test_function_graph.objective_function(para) == pytest.approx(
+            test_function_.objective_function(para)
+        )
+
+
+def test_shared_graph():
+    neighbor_graph.clear_neighbor_graphs()
+    k_neighbors_regressor = KNeighborsRegressorFunction()
+    k_neighbors_regressor.reuse_neighbor_graph = True
+
+    for n_neighbors in k_neighbors_regressor.n_neighbors_default:
+        for algorithm in k_neighbors_regressor.algorithm_default:
+            k_neighbors_regressor.objective_function(
+                {
+                    "n_neighbors": n_neighbors,
+                    "algorithm": algorithm,
+                    "cv": 2,
+                    "dataset": "diabetes_data",
+                }
+            )
+    assert len(neighbor_graph._neighbor_graphs) == 1
+
+
+def test_bounded_graphs(monkeypatch):
+    neighbor_graph.clear_neighbor_graphs()
+    monkeypatch.setattr(neighbor_graph, "max_neighbor_graphs", 2)
+
+    for cv in [2, 3, 4]:
+        neighbor_graph.get_neighbor_graph("iris_data", cv, 5)
+    assert [key[1] for key in neighbor_graph._neighbor_graphs] == [3, 4]
+
+    neighbor_graph.clear_neighbor_graphs()
+    assert len(neighbor_graph._neighbor_graphs) == 0
+
+
+def test_n_neighbors_too_large():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    k_neighbors_classifier.reuse_neighbor_graph = True
+
+    para = {"n_neighbors": 1000, "algorithm": "auto", "cv": 2, "dataset": "iris_data"}
+    with pytest.raises(ValueError, match="n_neighbors"):
+        k_neighbors_classifier.objective_function(para)
@@ -0,0 +1,59 @@
+import time
+import asyncio
+
+from surfaces.virtual_clock import VirtualClock
+from surfaces.test_functions.mathematical import SphereFunction
+from surfaces.test_functions.machine_learning import KNeighborsClassifierFunction
+
+
+def test_concurrent_sleep():
+    sphere_function = SphereFunction(n_dim=2, sleep=0.2)
+    paras = [{"x0": x0, "x1": 1} for x0 in range(1000)]
+
+    async def run():
+        evaluations = [sphere_function.objective_function_async(para) for para in paras]
+        return await asyncio.gather(*evaluations)
+
+    start = time.time()
+    scores = asyncio.run(run())
+
+    assert time.time() - start < 2
+    assert scores == [-(x0**2 + 1) for x0 in range(1000)]
+
+
+def test_virtual_clock():
+    sphere_function = SphereFunction(n_dim=2, sleep=5)
+    sphere_function.clock = VirtualClock()
+
+    async def run():
+        evaluations = [
+            sphere_function.objective_function_async({"x0": 1, "x1": 1})
+            for _ in range(10)
+        ]
+        return await asyncio.gather(*evaluations)
+
+    asyncio.run(run())
+    assert sphere_function.clock.time() == 50
+
+
+def test_machine_learning_function():
+    k_neighbors_classifier = KNeighborsClassifierFunction()
+    search_space = k_neighbors_classifier.search_space()
+    paras = [
+        {
+            "n_neighbors": n_neighbors,
+            "algorithm": "auto",
+            "cv": 2,
+            "dataset": search_space["dataset"][1],
+        }
+        for n_neighbors in search_space["n_neighbors"][:8]
+    ]
+
+    async def run():
+        evaluations = [
+            k_neighbors_classifier.objective_function_async(para) for para in paras
+        ]
+        return await asyncio.gather(*evaluations)
+
+    scores = asyncio.run(run())
+    assert scores == [k_neighbors_classifier.objective_function(para) for para in paras]
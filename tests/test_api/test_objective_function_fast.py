@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+
+from surfaces.virtual_clock import VirtualClock
+from surfaces.test_functions import mathematical_functions
+from surfaces.test_functions.mathematical import SphereFunction
+
+
+mathematical_functions_d = (
+    "test_function",
+    mathematical_functions,
+)
+
+
+metric_d = (
+    "metric",
+    ["score", "loss"],
+)
+
+
+@pytest.mark.parametrize(*mathematical_functions_d)
+@pytest.mark.parametrize(*metric_d)
+def test_positional(test_function, metric):
+    try:
+        test_function_ = test_function(metric=metric)
+    except TypeError:
+        test_function_ = test_function(n_dim=3, metric=metric)
+
+    search_space = test_function_.search_space(value_types="array")
+    args = [dim_values[len(dim_values) // 3] for dim_values in search_space.values()]
+    para = dict(zip(search_space.keys(), args))
+
+    np.testing.assert_array_equal(
+        test_function_.objective_function_fast(*args),
+        test_function_.objective_function(para),
+    )
+
+
+@pytest.mark.parametrize(*mathematical_functions_d)
+@pytest.mark.parametrize(*metric_d)
+def test_array(test_function, metric):
+    try:
+        test_function_ = test_function(metric=metric)
+    except TypeError:
+        test_function_ = test_function(n_dim=3, metric=metric)
+
+    X = np.linspace(-0.9, 0.8, 10 * test_function_.n_dim).reshape(10, -1)
+    if test_function_.n_dim == 1:
+        results = test_function_.objective_function_fast(X[:, 0])
+    else:
+        results = test_function_.objective_function_fast(X)
+
+    np.testing.assert_array_equal(results, test_function_.evaluate_batch(X))
+
+
+def test_metric_error():
+    with pytest.raises(ValueError):
+        mathematical_functions[0](metric="accuracy")
+
+
+def test_metric_and_sleep_changed():
+    sphere_function = SphereFunction(n_dim=2, metric="loss")
+    sphere_function.clock = VirtualClock()
+
+    sphere_function.metric = "score"
+    sphere_function.sleep = 3
+    assert sphere_function.objective_function_fast(1, 1) == -2
+    assert sphere_function.objective_function({"x0": 1, "x1": 1}) == -2
+    assert sphere_function.clock.time() == 6
@@ -0,0 +1,84 @@
+import pickle
+import pytest
+from multiprocessing import Pool
+
+from hyperactive import Hyperactive
+
+from surfaces.test_functions import mathematical_functions, machine_learning_functions
+from surfaces.test_functions.mathematical import SphereFunction
+
+
+mathematical_functions_d = (
+    "test_function",
+    mathematical_functions,
+)
+
+
+machine_learning_functions_d = (
+    "test_function",
+    machine_learning_functions,
+)
+
+
+@pytest.mark.parametrize(*mathematical_functions_d)
+def test_mathematical(test_function):
+    try:
+        test_function_ = test_function(metric="loss", sleep=0)
+    except TypeError:
+        test_function_ = test_function(n_dim=3, metric="loss", sleep=0)
+
+    search_space = test_function_.search_space(value_types="array")
+    para = {
+        para_name: dim_values[len(dim_values) // 3]
+        for para_name, dim_values in search_space.items()
+    }
+
+    test_function_loaded = pickle.loads(pickle.dumps(test_function_))
+    objective_function = pickle.loads(pickle.dumps(test_function_.objective_function))
+
+    assert test_function_loaded.objective_function(para) == (
+        test_function_.objective_function(para)
+    )
+    assert test_function_loaded.objective_function_fast(*para.values()) == (
+        test_function_.objective_function_fast(*para.values())
+    )
+    assert objective_function(para) == test_function_.objective_function(para)
+
+
+@pytest.mark.parametrize(*machine_learning_functions_d)
+def test_machine_learning(test_function):
+    test_function_ = test_function()
+    search_space = test_function_.search_space()
+    para = {
+        para_name: search_space[para_name][0] for para_name in test_function_.para_names
+    }
+    para["cv"] = 2
+
+    test_function_loaded = pickle.loads(pickle.dumps(test_function_))
+    # gradient boosting is not deterministic without a random state
+    assert test_function_loaded.objective_function(para) == pytest.approx(
+        test_function_.objective_function(para), rel=0.05
+    )
+
+
+def test_multiprocessing():
+    sphere_function = SphereFunction(n_dim=2, metric="loss")
+    list_of_params = [{"x0": x0, "x1": 1} for x0 in range(4)]
+
+    with Pool(2) as pool:
+        losses = pool.map(sphere_function.objective_function, list_of_params)
+
+    assert losses == [x0**2 + 1 for x0 in range(4)]
+
+
+def test_hyperactive_n_jobs():
+    sphere_function = SphereFunction(n_dim=2)
+
+    hyper = Hyperactive()
+    hyper.add_search(
+        sphere_function.objective_function,
+        sphere_function.search_space(value_types="list"),
+        n_iter=15,
+        n_jobs=2,
+    )
+    hyper.run()
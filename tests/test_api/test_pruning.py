@@ -0,0 +1,60 @@
+import pickle
+import pytest
+
+from surfaces.test_functions.machine_learning import KNeighborsRegressorFunction
+from surfaces.test_functions.machine_learning.tabular.pruning import PrunedScore
+
+
+para = {"n_neighbors": 5, "algorithm": "auto", "cv": 5, "dataset": "diabetes_data"}
+
+
+def test_pruned():
+    reported = []
+
+    def pruner(params, fold, scores):
+        reported.append((fold, list(scores)))
+        return fold == 1
+
+    k_neighbors_regressor = KNeighborsRegressorFunction()
+    k_neighbors_regressor.pruner = pruner
+    score = k_neighbors_regressor.objective_function(para)
+
+    assert isinstance(score, PrunedScore)
+    assert score.pruned
+    assert (score.n_folds, score.n_folds_total) == (2, 5)
+    assert [fold for fold, _ in reported] == [0, 1]
+    assert score == pytest.approx(sum(reported[-1][1]) / 2)
+
+
+def test_not_pruned():
+    k_neighbors_regressor = KNeighborsRegressorFunction()
+    k_neighbors_regressor.pruner = lambda params, fold, scores: False
+    score = k_neighbors_regressor.objective_function(para)
+
+    assert not isinstance(score, PrunedScore)
+    k_neighbors_regressor.pruner = None
+    assert score == pytest.approx(k_neighbors_regressor.objective_function(para))
+
+
+def test_pruned_not_cached():
+    from surfaces.evaluation_cache import EvaluationCache
+
+    k_neighbors_regressor = KNeighborsRegressorFunction()
+    k_neighbors_regressor.cache = EvaluationCache()
+    k_neighbors_regressor.pruner = lambda params, fold, scores: True
+
+    assert isinstance(k_neighbors_regressor.objective_function(para), PrunedScore)
+    assert len(k_neighbors_regressor.cache) == 0
+
+    # the next call evaluates all folds
+    k_neighbors_regressor.pruner = None
+    score = k_neighbors_regressor.objective_function(para)
+    assert not isinstance(score, PrunedScore)
+    assert len(k_neighbors_regressor.cache) == 1
+
+
+def test_pickle_pruned_score():
+    score = pickle.loads(pickle.dumps(PrunedScore(0.5, 2, 5)))
+
+    assert score == 0.5
+    assert (score.n_folds, score.n_folds_total) == (2, 5)
@@ -0,0 +1,82 @@
+import pickle
+import pytest
+import numpy as np
+
+from surfaces.test_functions.machine_learning import KNeighborsRegressorFunction
+from surfaces.data_collector import SurfacesDataCollector, ScoreTensor
+
+
+def _search_space(test_function_):
+    return test_function_.search_space(
+        n_neighbors=[3, 4, 5],
+        algorithm=["auto", "brute"],
+        cv=[2, 3],
+        dataset=[test_function_.dataset_default[0]],
+    )
+
+
+@pytest.fixture(scope="module")
+def sdc(tmp_path_factory):
+    test_function_ = KNeighborsRegressorFunction()
+
+    search_data_path = tmp_path_factory.mktemp("score_tensor") / "search_data.db"
+    sdc = SurfacesDataCollector(path=str(search_data_path))
+    sdc.collect(
+        test_function_.objective_function,
+        _search_space(test_function_),
+        if_exists="replace",
+    )
+    yield sdc
+    sdc.remove()
+
+
+def test_score_tensor(sdc, tmp_path):
+    test_function_ = KNeighborsRegressorFunction()
+    search_space = _search_space(test_function_)
+
+    sdc.load_score_tensor(test_function_._name_, search_space).save(
+        tmp_path / "scores.npy"
+    )
+    score_tensor = ScoreTensor.load(tmp_path / "scores.npy", search_space)
+    assert isinstance(score_tensor.scores, np.memmap)
+    assert score_tensor.scores.shape == (3, 2, 2, 1)
+
+    test_function_loaded = KNeighborsRegressorFunction(evaluate_from_data=True)
+    test_function_loaded.sdc = sdc
+    list_of_params = [
+        {
+            "n_neighbors": n_neighbors,
+            "algorithm": "auto",
+            "cv": cv,
+            "dataset": test_function_.dataset_default[0],
+        }
+        for n_neighbors in [3, 4, 5]
+        for cv in [2, 3]
+    ]
+    scores_sql = [test_function_loaded.objective_function(p) for p in list_of_params]
+
+    test_function_loaded.score_tensor = score_tensor
+    assert test_function_loaded.evaluate_batch(list_of_params).tolist() == scores_sql
+    assert [
+        test_function_loaded.objective_function(p) for p in list_of_params
+    ] == scores_sql
+
+    # the memory map is reopened in other processes
+    score_tensor_loaded = pickle.loads(pickle.dumps(score_tensor))
+    assert isinstance(score_tensor_loaded.scores, np.memmap)
+    assert score_tensor_loaded.lookup(list_of_params).tolist() == scores_sql
+
+
+def test_missing_scores():
+    search_space = {"x0": [0, 1, 2], "x1": [0, 1]}
+    search_data = {"x0": [0, 1, 5], "x1": [0, 1, 1], "score": [0.5, 1.5, 2.5]}
+    score_tensor = ScoreTensor.from_search_data(search_data, search_space)
+
+    assert score_tensor.lookup_positions([[0, 0], [1, 1]]).tolist() == [0.5, 1.5]
+    with pytest.raises(KeyError, match="No score"):
+        score_tensor.lookup([{"x0": 2, "x1": 0}])
+    with pytest.raises(KeyError, match="not in the search space"):
+        score_tensor.lookup([{"x0": 5, "x1": 1}])
+
+    with pytest.raises(ValueError):
+        ScoreTensor(np.zeros((3, 3)), search_space)
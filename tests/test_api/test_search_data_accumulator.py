@@ -0,0 +1,32 @@
+import pandas as pd
+
+from surfaces.data_collector.search_data_accumulator import SearchDataAccumulator
+
+
+def test_deduplicated_on_insertion():
+    search_data = SearchDataAccumulator(["x0", "x1"])
+
+    n_new = search_data.add(
+        pd.DataFrame(
+            {"x0": [0, 0, 1], "x1": [0, 0, 1], "score": [1.0, 2.0, 3.0], "iter": 0}
+        )
+    )
+    assert n_new == 2
+
+    n_new = search_data.add(
+        pd.DataFrame({"x0": [1, 2], "x1": [1, 2], "score": [4.0, 5.0], "iter": 1})
+    )
+    assert n_new == 1
+    assert len(search_data) == 3
+
+    search_data_df = search_data.to_frame()
+    assert list(search_data_df.columns) == ["x0", "x1", "score"]
+    # the first row of a parameter combination is kept
+    assert search_data_df["score"].tolist() == [1.0, 3.0, 5.0]
+
+
+def test_empty():
+    search_data = SearchDataAccumulator(["x0"])
+
+    assert len(search_data) == 0
+    assert list(search_data.to_frame().columns) == ["x0", "score"]
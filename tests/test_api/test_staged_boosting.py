@@ -0,0 +1,44 @@
+import pytest
+
+from surfaces.test_functions.machine_learning import GradientBoostingRegressorFunction
+from surfaces.test_functions.machine_learning.tabular import staged_boosting
+
+
+def _para(n_estimators, max_depth=3):
+    return {
+        "n_estimators": n_estimators,
+        "max_depth": max_depth,
+        "cv": 2,
+        "dataset": "diabetes_data",
+    }
+
+
+def test_same_scores():
+    gradient_boosting_regressor = GradientBoostingRegressorFunction()
+    gradient_boosting_regressor_staged = GradientBoostingRegressorFunction()
+    gradient_boosting_regressor_staged.staged_n_estimators = True
+
+    for n_estimators in [3, 23]:
+        # the trees are not seeded, so the scores are only close
+        assert gradient_boosting_regressor_staged.objective_function(
+            _para(n_estimators)
+        ) == pytest.approx(
+            gradient_boosting_regressor.objective_function(_para(n_estimators)),
+            abs=1e-2,
+        )
+
+
+def test_one_fit_per_group():
+    staged_boosting._staged_scores.clear()
+    gradient_boosting_regressor = GradientBoostingRegressorFunction()
+    gradient_boosting_regressor.staged_n_estimators = True
+
+    scores = gradient_boosting_regressor.evaluate_batch(
+        [
+            _para(n_estimators, max_depth)
+            for n_estimators in gradient_boosting_regressor.n_estimators_default
+            for max_depth in [2, 3]
+        ]
+    )
+    assert len(scores) == 2 * len(gradient_boosting_regressor.n_estimators_default)
+    assert len(staged_boosting._staged_scores) == 2
@@ -0,0 +1,210 @@
+import os
+import pytest
+import pandas as pd
+
+from surfaces.data_collector import SurfacesDataCollector
+
+
+storage_d = ("storage", ["sql", "parquet"])
+
+
+@pytest.fixture
+def sdc(storage, tmp_path):
+    if storage == "parquet":
+        pytest.importorskip("pyarrow")
+    path = os.path.join(tmp_path, "search_data.db" if storage == "sql" else "data")
+    return SurfacesDataCollector(path=path, storage=storage)
+
+
+def iris_data():
+    pass
+
+
+search_data = pd.DataFrame(
+    {
+        "x0": [0, 1, 2, 3],
+        "dataset": ["digits_data", "wine_data", "iris_data", "wine_data"],
+        "score": [0.1, 0.2, 0.3, 0.4],
+    }
+)
+
+
+@pytest.mark.parametrize(*storage_d)
+def test_save_and_append(sdc):
+    sdc.save("table", search_data.iloc[:2])
+    sdc.save("table", search_data.iloc[2:], if_exists="append")
+
+    assert sdc.load("table")["score"].tolist() == [0.1, 0.2, 0.3, 0.4]
+
+    sdc.save("table", search_data.iloc[:1], if_exists="replace")
+    assert len(sdc.load("table")) == 1
+
+
+@pytest.mark.parametrize(*storage_d)
+def test_columns_and_filters(sdc):
+    sdc.save("table", search_data)
+
+    assert list(sdc.load("table", columns=["score"]).columns) == ["score"]
+
+    filtered = sdc.load("table", filters={"dataset": "wine_data", "x0": [1, 2, 3]})
+    assert filtered["x0"].tolist() == [1, 3]
+
+    # functions are filtered by their name, like they are stored
+    filtered = sdc.load("table", filters={"dataset": iris_data})
+    assert filtered["x0"].tolist() == [2]
+
+
+@pytest.mark.parametrize(*storage_d)
+def test_collect(sdc):
+    def objective_function(params):
+        return params["x0"] * 2
+
+    sdc.collect(objective_function, {"x0": [1, 2, 3], "dataset": ["iris_data"]})
+    sdc.collect(objective_function, {"x0": [1, 2, 3, 4], "dataset": ["iris_data"]})
+
+    assert sorted(sdc.load("objective_function")["score"].tolist()) == [2, 4, 6, 8]
+    assert sdc.tables == ["objective_function"]
+
+    sdc.remove()
+
+
+@pytest.mark.parametrize(*storage_d)
+def test_collect_into_table_without_eval_time(sdc):
+    def objective_function(params):
+        return params["x0"] * 2
+
+    sdc.save("objective_function", pd.DataFrame({"x0": [1], "score": [2]}))
+    sdc.collect(objective_function, {"x0": [1, 2, 3]})
+
+    search_data = sdc.load("objective_function").sort_values("x0")
+    assert search_data["score"].tolist() == [2, 4, 6]
+    assert search_data["eval_time"].isna().tolist() == [True, False, False]
+
+
+def test_unknown_storage():
+    with pytest.raises(ValueError, match="Unknown storage"):
+        SurfacesDataCollector(storage="csv")
+
+
+def test_sql_index_and_wal(tmp_path):
+    import sqlalchemy as sql
+
+    sdc = SurfacesDataCollector(path=os.path.join(tmp_path, "search_data.db"))
+    sdc.save("table", search_data)
+
+    with sdc.storage.dbEngine.connect() as connection:
+        journal_mode = connection.execute(sql.text("PRAGMA journal_mode")).scalar()
+    indexes = sql.inspect(sdc.storage.dbEngine).get_indexes("table")
+
+    assert journal_mode == "wal"
+    assert [index["column_names"] for index in indexes] == [["x0", "dataset"]]
+
+
+def test_sql_load_read_only(tmp_path):
+    import sqlite3
+
+    path = os.path.join(tmp_path, "search_data.db")
+    connection = sqlite3.connect(path)
+    search_data.to_sql("table", connection, index=False)
+    connection.close()
+    os.chmod(path, 0o444)
+
+    sdc = SurfacesDataCollector(path=path)
+    assert len(sdc.load("table")) == 4
+    # loading does not switch the database to WAL mode
+    assert os.listdir(tmp_path) == ["search_data.db"]
+
+
+def test_sql_remove(tmp_path):
+    sdc = SurfacesDataCollector(path=os.path.join(tmp_path, "search_data.db"))
+    sdc.save("table", search_data)
+    sdc.load("table")
+    sdc.remove()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_concurrent_writes(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    from surfaces.data_collector.storage import SearchDataWriter
+
+    sdc = SurfacesDataCollector(path=os.path.join(tmp_path, "search_data.db"))
+    with SearchDataWriter(sdc.storage) as writer:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for x0 in range(20):
+                executor.submit(
+                    writer.put,
+                    "table",
+                    pd.DataFrame({"x0": [x0], "dataset": ["iris_data"], "score": 0.5}),
+                )
+
+    assert sorted(sdc.load("table")["x0"].tolist()) == list(range(20))
+
+
+def test_writer_error():
+    import time
+    from surfaces.data_collector.storage import SearchDataWriter
+
+    class FailingStorage:
+        def save(self, table, dataframe, if_exists):
+            raise OSError("disk full")
+
+    writer = SearchDataWriter(FailingStorage())
+    writer.put("table", search_data)
+    while writer.error is None:
+        time.sleep(0.01)
+
+    # the error stops the producer at its next put
+    with pytest.raises(OSError, match="disk full"):
+        writer.put("table", search_data)
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+
+
+def test_sql_compact(tmp_path):
+    import sqlalchemy as sql
+
+    sdc = SurfacesDataCollector(
+        path=os.path.join(tmp_path, "search_data.db"), compact=True
+    )
+    sdc.save("table", search_data.iloc[:2])
+    sdc.save("table", search_data.iloc[2:], if_exists="append")
+
+    with sdc.storage.dbEngine.connect() as connection:
+        stored = connection.execute(sql.text('SELECT dataset FROM "table"')).all()
+    assert [row[0] for row in stored] == [0, 1, 2, 1]
+    assert sdc.tables == ["table"]
+
+    # decoded on load, also with filters on the encoded column
+    assert sdc.load("table")["dataset"].tolist() == search_data["dataset"].tolist()
+    filtered = sdc.load("table", filters={"dataset": ["wine_data", "iris_data"]})
+    assert filtered["x0"].tolist() == [1, 2, 3]
+
+    sdc.remove("table")
+    assert not sdc.storage.has_table("table__dictionary")
+
+
+def test_parquet_float32_scores(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    sdc = SurfacesDataCollector(
+        path=os.path.join(tmp_path, "data"), storage="parquet", float32_scores=True
+    )
+    sdc.save("table", search_data)
+
+    assert sdc.load("table")["score"].dtype == "float32"
+
+
+def test_parquet_unique_files(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    sdc = SurfacesDataCollector(path=os.path.join(tmp_path, "data"), storage="parquet")
+    for i in range(4):
+        sdc.save("table", search_data.iloc[i : i + 1], if_exists="append")
+    table_path = sdc.storage.table_path("table")
+    # a deleted file does not lead to an overwritten one
+    os.remove(os.path.join(table_path, sorted(os.listdir(table_path))[1]))
+    sdc.save("table", search_data.iloc[1:2], if_exists="append")
+
+    assert len(os.listdir(table_path)) == 4
+    assert sdc.load("table")["score"].tolist() == [0.1, 0.3, 0.4, 0.2]
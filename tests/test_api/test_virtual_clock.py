@@ -0,0 +1,52 @@
+import time
+import numpy as np
+
+from surfaces.virtual_clock import VirtualClock
+from surfaces.test_functions.mathematical import SphereFunction, AckleyFunction
+from surfaces.test_functions.machine_learning import KNeighborsRegressorFunction
+
+
+def test_objective_function():
+    sphere_function = SphereFunction(n_dim=2, sleep=1)
+    sphere_function.clock = VirtualClock()
+
+    start = time.time()
+    for _ in range(1000):
+        sphere_function.objective_function({"x0": 1, "x1": 2})
+
+    assert time.time() - start < 1
+    assert sphere_function.clock.time() == 1000
+
+
+def test_fast_and_batch():
+    ackley_function = AckleyFunction(sleep=0.5)
+    ackley_function.clock = VirtualClock(start=10)
+
+    ackley_function.objective_function_fast(1, 2)
+    ackley_function.evaluate_batch(np.zeros((10, 2)))
+
+    assert ackley_function.clock.time() == 10 + 0.5 * 11
+
+    ackley_function.clock.reset()
+    assert ackley_function.clock.time() == 10
+
+
+def test_shared_clock():
+    clock = VirtualClock()
+
+    sphere_function = SphereFunction(n_dim=2, sleep=2)
+    k_neighbors_regressor = KNeighborsRegressorFunction(sleep=30)
+    sphere_function.clock = clock
+    k_neighbors_regressor.clock = clock
+
+    sphere_function.objective_function({"x0": 1, "x1": 2})
+    k_neighbors_regressor.objective_function(
+        {
+            "n_neighbors": 5,
+            "algorithm": "auto",
+            "cv": 2,
+            "dataset": k_neighbors_regressor.dataset_default[0],
+        }
+    )
+
+    assert clock.time() == 32
@@ -2,7 +2,11 @@ import os
 import pytest
 
 from surfaces.test_functions import mathematical_functions, machine_learning_functions
-from surfaces.test_functions.machine_learning import KNeighborsRegressorFunction
+from surfaces.test_functions.mathematical import SphereFunction
+from surfaces.test_functions.machine_learning import (
+    KNeighborsClassifierFunction,
+    KNeighborsRegressorFunction,
+)
 from surfaces.data_collector import SurfacesDataCollector
 
 here_path = os.path.dirname(os.path.realpath(__file__))
@@ -47,3 +51,87 @@ def test_all_machine_learning_functions():
     sdc = SurfacesDataCollector(path=search_data_path)
     sdc.collect(objective_function, search_space)
     sdc.remove()
+
+
+def test_grid_one_pass(tmp_path):
+    test_function_ = SphereFunction(n_dim=2)
+    search_space = test_function_.search_space(value_types="array", size=400)
+
+    sdc = SurfacesDataCollector(path=os.path.join(tmp_path, "search_data.db"))
+    sdc.grid_chunk_size = 150
+    sdc.collect(test_function_.objective_function, search_space)
+    search_data = sdc.load("sphere_function")
+    sdc.remove()
+
+    assert len(search_data) == 400
+    assert not search_data.duplicated(subset=["x0", "x1"]).any()
+
+    para = search_data.iloc[123]
+    assert para["score"] == pytest.approx(
+        test_function_.objective_function({"x0": para["x0"], "x1": para["x1"]})
+    )
+
+
+def test_collect_grid_twice(tmp_path):
+    test_function_ = SphereFunction(n_dim=2)
+    search_space = test_function_.search_space(value_types="array", size=100)
+
+    sdc = SurfacesDataCollector(path=os.path.join(tmp_path, "search_data.db"))
+    sdc.collect(test_function_.objective_function, search_space)
+    sdc.collect(test_function_.objective_function, search_space)
+    assert len(sdc.load("sphere_function")) == 100
+
+    sdc.collect(test_function_.objective_function, search_space, if_exists="replace")
+    assert len(sdc.load("sphere_function")) == 100
+    sdc.remove()
+
+
+def test_resume_collection(tmp_path):
+    evaluated = []
+
+    def objective_function(params):
+        evaluated.append(params["x"])
+        return params["x"] * params["y"]
+
+    sdc = SurfacesDataCollector(path=os.path.join(tmp_path, "search_data.db"))
+    sdc.collect(objective_function, {"x": [1, 2], "y": [1, 2, 3]}, batch_size=4)
+    sdc.collect(objective_function, {"x": [1, 2, 3], "y": [1, 2, 3]}, batch_size=4)
+    search_data = sdc.load("objective_function")
+    sdc.remove()
+
+    # the configurations of the first collection are not evaluated again
+    assert len(evaluated) == 9
+    assert len(search_data) == 9
+    assert not search_data.duplicated(subset=["x", "y"]).any()
+
+
+def test_parallel_collection(tmp_path):
+    test_function_ = KNeighborsRegressorFunction()
+    search_space = test_function_.search_space(
+        n_neighbors=[3, 4, 5, 6], cv=[2], dataset=[test_function_.dataset_default[0]]
+    )
+
+    sdc = SurfacesDataCollector(path=os.path.join(tmp_path, "search_data.db"))
+    sdc.collect(test_function_.objective_function, search_space, n_jobs=2)
+    search_data = sdc.load("k_neighbors_regressor")
+    sdc.remove()
+
+    assert len(search_data) == 4 * len(test_function_.algorithm_default)
+
+
+@pytest.mark.parametrize("storage", ["sql", "parquet"])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_collect_metric_records(tmp_path, storage, n_jobs):
+    test_function_ = KNeighborsClassifierFunction(metric=["accuracy", "f1_macro"])
+    search_space = test_function_.search_space(
+        n_neighbors=[3, 4], algorithm=["auto"], cv=[2], dataset=["iris_data"]
+    )
+
+    sdc = SurfacesDataCollector(path=os.path.join(tmp_path, "data"), storage=storage)
+    sdc.collect(test_function_.objective_function, search_space, n_jobs=n_jobs)
+    search_data = sdc.load("k_neighbors_classifier")
+
+    # every metric and the fit and score times are stored with the score
+    columns = ["metric_accuracy", "metric_f1_macro", "fit_time", "score_time"]
+    assert set(columns) <= set(search_data.columns)
+    assert (search_data["score"] == search_data["metric_accuracy"]).all()